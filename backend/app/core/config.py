@@ -4,11 +4,17 @@ This module provides centralized configuration management for the Claude Usage
 Dashboard backend, supporting environment variables and .env file loading.
 """
 
-from functools import lru_cache
+import os
+import time
+from functools import cached_property
 from pathlib import Path
 
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# How long a data path validity check stays fresh (seconds)
+DATA_PATH_CHECK_TTL = 30
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables.
@@ -16,11 +22,15 @@ class Settings(BaseSettings):
     Attributes:
         CLAUDE_DATA_PATH: Path to Claude's usage data directory.
             Defaults to ~/.claude/projects
-        CORS_ORIGINS: List of allowed CORS origins for cross-origin requests.
+        CORS_ORIGINS: Allowed CORS origins for cross-origin requests.
+        CORS_ALLOW_METHODS: HTTP methods allowed for cross-origin requests.
+        CORS_ALLOW_HEADERS: Request headers allowed for cross-origin requests.
         DEBUG: Enable debug mode for development.
         API_PREFIX: URL prefix for all API routes.
         SESSION_WINDOW_HOURS: Rolling window duration for session calculations.
+        REALTIME_CACHE_TTL: Seconds a realtime usage snapshot is reused.
         WEBSOCKET_BROADCAST_INTERVAL: Seconds between WebSocket broadcasts.
+        WEBSOCKET_BINARY_FRAMES: Send broadcast JSON as binary frames.
         LOG_LEVEL: Logging level for the application.
     """
 
@@ -34,21 +44,21 @@ class Settings(BaseSettings):
     # Data source configuration
     CLAUDE_DATA_PATH: str = str(Path.home() / ".claude" / "projects")
 
-    # CORS configuration
-    CORS_ORIGINS: list[str] = [
+    # CORS configuration (immutable tuples, no per-instance deep copy)
+    CORS_ORIGINS: tuple[str, ...] = (
         "http://localhost:3000",
         "http://127.0.0.1:3000",
         "http://localhost:8000",
         "http://127.0.0.1:8000",
-    ]
-    CORS_ALLOW_METHODS: list[str] = ["GET", "POST", "OPTIONS"]
-    CORS_ALLOW_HEADERS: list[str] = [
+    )
+    CORS_ALLOW_METHODS: tuple[str, ...] = ("GET", "POST", "OPTIONS")
+    CORS_ALLOW_HEADERS: tuple[str, ...] = (
         "Accept",
         "Accept-Language",
         "Content-Type",
         "Authorization",
         "X-Requested-With",
-    ]
+    )
 
     # WebSocket authentication
     WEBSOCKET_API_KEY: str = ""  # Optional: Set via environment variable for WS auth
@@ -61,39 +71,79 @@ class Settings(BaseSettings):
 
     # Session configuration
     SESSION_WINDOW_HOURS: int = 5
+    REALTIME_CACHE_TTL: float = 1.0  # seconds, while the data is unchanged
 
     # WebSocket configuration
     WEBSOCKET_BROADCAST_INTERVAL: int = 10  # seconds
+    WEBSOCKET_BINARY_FRAMES: bool = True  # False: send JSON as text frames
 
     # Logging configuration
     LOG_LEVEL: str = "INFO"
 
+    # Resolved data path and (expires_at, is_valid) validity check cache
+    _data_path: Path | None = PrivateAttr(default=None)
+    _data_path_valid: tuple[float, bool] | None = PrivateAttr(default=None)
+
+    @cached_property
+    def cors_origins_set(self) -> frozenset[str]:
+        """Get the allowed CORS origins as a frozenset.
+
+        Used by the CORS middleware so origin checks are hash lookups
+        instead of linear scans.
+
+        Returns:
+            frozenset[str]: The configured CORS origins.
+        """
+        return frozenset(self.CORS_ORIGINS)
+
     def get_data_path(self) -> Path:
         """Get the Claude data path as a Path object.
 
+        The path is computed once and reused, since settings are
+        immutable for the lifetime of the process.
+
         Returns:
-            Path: Resolved and expanded path to the Claude data directory.
+            Path: Absolute, user-expanded path to the Claude data directory.
         """
-        return Path(self.CLAUDE_DATA_PATH).expanduser().resolve()
+        if self._data_path is None:
+            # os.path is cheaper than Path.expanduser().resolve() and
+            # symlink resolution isn't needed here
+            self._data_path = Path(
+                os.path.abspath(os.path.expanduser(self.CLAUDE_DATA_PATH))
+            )
+        return self._data_path
 
     def is_data_path_valid(self) -> bool:
         """Check if the configured data path exists and is readable.
 
+        The result is cached for DATA_PATH_CHECK_TTL seconds so that
+        frequent health checks don't hit the filesystem every time.
+
         Returns:
             bool: True if the path exists and is a directory.
         """
+        now = time.monotonic()
+        cached = self._data_path_valid
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
         path = self.get_data_path()
-        return path.exists() and path.is_dir()
+        is_valid = path.exists() and path.is_dir()
+        self._data_path_valid = (now + DATA_PATH_CHECK_TTL, is_valid)
+        return is_valid
+
+
+# Process-wide settings instance, loaded once at import
+SETTINGS = Settings()
 
 
-@lru_cache
 def get_settings() -> Settings:
-    """Get cached application settings instance.
+    """Get the application settings instance.
 
-    Uses LRU cache to ensure settings are loaded only once
-    during the application lifecycle.
+    Settings are loaded once at import time; this returns the shared
+    instance without any caching wrapper overhead.
 
     Returns:
         Settings: The application settings instance.
     """
-    return Settings()
+    return SETTINGS
@@ -0,0 +1,48 @@
+"""Error handling helpers shared by the API routers."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import ParamSpec, TypeVar
+
+from fastapi import HTTPException, status
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+async def call_service(
+    operation: str,
+    func: Callable[P, T],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> T:
+    """Call a data service method, mapping failures to an HTTP 500.
+
+    The method runs in a worker thread, so its blocking disk I/O and
+    aggregation don't stall the event loop. The full traceback is logged
+    server-side; the client only receives a generic message so internal
+    error details are not leaked.
+
+    Args:
+        operation: Human-readable name of the data being retrieved.
+        func: The service method to call.
+        *args: Positional arguments for the service method.
+        **kwargs: Keyword arguments for the service method.
+
+    Returns:
+        The service method's return value.
+
+    Raises:
+        HTTPException: If the service method raises.
+    """
+    try:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    except Exception as e:
+        logger.exception("Failed to retrieve %s", operation)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve {operation}",
+        ) from e
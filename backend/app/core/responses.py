@@ -0,0 +1,49 @@
+"""Custom response classes for the API.
+
+This module provides an orjson-backed JSON response used as the default
+response class for all routes, and a helper for returning Pydantic
+models without FastAPI re-validating them.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson.
+
+    orjson is a C extension that natively handles datetime, dataclass
+    and numeric types, and renders straight to bytes, which makes it
+    considerably faster than the stdlib json module.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the response content to JSON bytes.
+
+        Args:
+            content: The JSON-compatible content to serialize.
+
+        Returns:
+            bytes: The encoded JSON document.
+        """
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_response(model: BaseModel) -> Response:
+    """Serialize an already-validated model straight to a JSON response.
+
+    Routes using this declare response_model=None, so FastAPI does not
+    validate the returned model a second time before encoding it.
+
+    Args:
+        model: The response model produced by the data service.
+
+    Returns:
+        Response containing the model's JSON encoding.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
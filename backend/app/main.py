@@ -4,29 +4,46 @@ This module configures and creates the FastAPI application instance
 with all routes, middleware, and lifecycle handlers.
 """
 
+import asyncio
+import atexit
 import logging
+import queue
+import time
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
 from datetime import timezone as tz
+from logging.handlers import QueueHandler, QueueListener
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
-from app.core.config import get_settings
+from app.core.config import SETTINGS, get_settings
+from app.core.responses import ORJSONResponse, model_response
 from app.models.schemas import HealthResponse
 from app.routers import stats, usage, websocket
 from app.routers.websocket import start_broadcast_task, stop_broadcast_task
 from app.services.data_service import warm_cache
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
+# Documentation route paths, shared by app setup and the root payload
+DOCS_URL = "/docs"
+REDOC_URL = "/redoc"
+OPENAPI_URL = "/openapi.json"
+
+# Background listener that writes queued log records to stderr
+_log_listener: QueueListener | None = None
+
+# UTC tzinfo bound once (datetime.UTC is only available on Python 3.11+)
+UTC = tz.utc
+_utc_now = datetime.now
+
+# (epoch second, timestamp) reused by health checks within the same second
+_health_timestamp: tuple[int, datetime] = (0, datetime.min)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -46,9 +63,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info(f"Data path: {settings.CLAUDE_DATA_PATH}")
     logger.info(f"Data path valid: {settings.is_data_path_valid()}")
 
-    # Pre-warm the cache for faster first requests
+    # Build and encode the OpenAPI schema before the first docs request
+    get_openapi_bytes(app)
+
+    # Pre-warm the cache in a worker thread so startup isn't blocked;
+    # /health reports degraded until warming finishes
+    warm_task: asyncio.Task[None] | None = None
     if settings.is_data_path_valid():
-        warm_cache()
+        app.state.cache_warm = False
+        warm_task = asyncio.create_task(asyncio.to_thread(warm_cache))
+        warm_task.add_done_callback(lambda _: setattr(app.state, "cache_warm", True))
 
     # Start WebSocket broadcast task
     start_broadcast_task()
@@ -58,9 +82,91 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown
     logger.info("Shutting down application...")
     stop_broadcast_task()
+    if warm_task is not None and not warm_task.done():
+        with suppress(Exception):
+            await warm_task
     logger.info("Application shutdown complete")
 
 
+def configure_logging(level: str) -> None:
+    """Configure root logging to write through a background queue.
+
+    Records are handed to a QueueHandler so request handlers never block
+    on log I/O; a QueueListener thread formats and writes them. Only the
+    first call has any effect.
+
+    Args:
+        level: Logging level name, e.g. "INFO".
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%dT%H:%M:%S",
+        )
+    )
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level.upper())
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    _log_listener = QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
+def _get_health_timestamp() -> datetime:
+    """Get the current UTC time at one-second granularity.
+
+    Health checks don't need sub-second precision, so the timestamp is
+    recomputed at most once per second.
+
+    Returns:
+        datetime: Current UTC time, reused within the same second.
+    """
+    global _health_timestamp
+    second = int(time.time())
+    if _health_timestamp[0] != second:
+        _health_timestamp = (second, _utc_now(UTC))
+    return _health_timestamp[1]
+
+
+def get_openapi_bytes(app: FastAPI) -> bytes:
+    """Get the encoded OpenAPI schema, building it on first use.
+
+    Args:
+        app: The FastAPI application instance.
+
+    Returns:
+        bytes: The OpenAPI schema serialized as JSON.
+    """
+    openapi_bytes: bytes | None = getattr(app.state, "openapi_bytes", None)
+    if openapi_bytes is None:
+        openapi_bytes = orjson.dumps(app.openapi())
+        app.state.openapi_bytes = openapi_bytes
+    return openapi_bytes
+
+
+async def openapi_json(request: Request) -> Response:
+    """Serve the pre-encoded OpenAPI schema.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        Response containing the OpenAPI JSON document.
+    """
+    return Response(
+        content=get_openapi_bytes(request.app),
+        media_type="application/json",
+    )
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -68,6 +174,7 @@ def create_app() -> FastAPI:
         FastAPI: Configured application instance.
     """
     settings = get_settings()
+    configure_logging(settings.LOG_LEVEL)
 
     app = FastAPI(
         title=settings.APP_NAME,
@@ -89,16 +196,17 @@ def create_app() -> FastAPI:
 
         Connect to `/ws/realtime` for live updates every 10 seconds.
         """,
-        docs_url="/docs",
-        redoc_url="/redoc",
-        openapi_url="/openapi.json",
+        docs_url=DOCS_URL,
+        redoc_url=REDOC_URL,
+        openapi_url=OPENAPI_URL,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
     # Configure CORS with restricted methods and headers
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=settings.CORS_ORIGINS,
+        allow_origins=settings.cors_origins_set,
         allow_credentials=True,
         allow_methods=settings.CORS_ALLOW_METHODS,
         allow_headers=settings.CORS_ALLOW_HEADERS,
@@ -109,69 +217,84 @@ def create_app() -> FastAPI:
     app.include_router(stats.router, prefix=settings.API_PREFIX)
     app.include_router(websocket.router)
 
+    # Replace the default OpenAPI route, which re-encodes the schema per hit
+    app.router.routes[:] = [
+        route for route in app.router.routes
+        if getattr(route, "path", None) != OPENAPI_URL
+    ]
+    app.add_api_route(OPENAPI_URL, openapi_json, include_in_schema=False)
+
     return app
 
 
 # Create the application instance
 app = create_app()
 
+# Root endpoint payload, encoded once
+_ROOT_BYTES = orjson.dumps({
+    "name": SETTINGS.APP_NAME,
+    "version": SETTINGS.APP_VERSION,
+    "documentation": DOCS_URL,
+    "openapi": OPENAPI_URL,
+})
+
+# Static health check fields, computed once
+_HEALTH_VERSION = SETTINGS.APP_VERSION
+_HEALTH_DETAILS: dict[str, object] = {
+    "data_path": SETTINGS.CLAUDE_DATA_PATH,
+    "session_window_hours": SETTINGS.SESSION_WINDOW_HOURS,
+    "websocket_interval": SETTINGS.WEBSOCKET_BROADCAST_INTERVAL,
+}
+
 
 @app.get(
     "/",
-    response_class=JSONResponse,
     include_in_schema=False,
 )
-async def root() -> dict:
+async def root() -> Response:
     """Root endpoint redirecting to documentation.
 
     Returns:
-        Dictionary with API info and documentation links.
+        Response with pre-encoded API info and documentation links.
     """
-    settings = get_settings()
-    return {
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "documentation": "/docs",
-        "openapi": "/openapi.json",
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get(
     "/health",
-    response_model=HealthResponse,
+    response_model=None,
     tags=["health"],
     summary="Health Check",
     description="Check the health status of the API and its dependencies.",
+    responses={status.HTTP_200_OK: {"model": HealthResponse}},
 )
-async def health_check() -> HealthResponse:
+async def health_check() -> Response:
     """Health check endpoint for monitoring.
 
     Returns:
-        HealthResponse with service status and details.
+        Response with the encoded HealthResponse: service status and details.
     """
-    settings = get_settings()
-    data_path_valid = settings.is_data_path_valid()
+    data_path_valid = SETTINGS.is_data_path_valid()
+    cache_warm = getattr(app.state, "cache_warm", True)
 
-    return HealthResponse(
-        status="healthy" if data_path_valid else "degraded",
-        version=settings.APP_VERSION,
+    # Inputs are trusted, so skip validation
+    health = HealthResponse.model_construct(
+        status="healthy" if data_path_valid and cache_warm else "degraded",
+        version=_HEALTH_VERSION,
         data_path_valid=data_path_valid,
-        timestamp=datetime.now(tz.utc),
-        details={
-            "data_path": settings.CLAUDE_DATA_PATH,
-            "session_window_hours": settings.SESSION_WINDOW_HOURS,
-            "websocket_interval": settings.WEBSOCKET_BROADCAST_INTERVAL,
-        },
+        timestamp=_get_health_timestamp(),
+        details=_HEALTH_DETAILS,
     )
+    return model_response(health)
 
 
 @app.get(
     "/api/health",
-    response_model=HealthResponse,
+    response_model=None,
     tags=["health"],
     include_in_schema=False,
 )
-async def api_health_check() -> HealthResponse:
+async def api_health_check() -> Response:
     """Alternative health check endpoint under /api prefix."""
     return await health_check()
 
@@ -5,18 +5,32 @@ to ensure type safety and automatic validation/serialization.
 """
 
 from datetime import datetime
+from functools import cached_property
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
-class UsageEntryResponse(BaseModel):
+class ResponseModel(BaseModel):
+    """Base class for read-only API response models.
+
+    Responses are never mutated after construction, so models are frozen
+    and reject unknown fields, which lets Pydantic skip the setattr and
+    extra-field handling paths.
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        validate_assignment=False,
+    )
+
+
+class UsageEntryResponse(ResponseModel):
     """Response model for a single usage entry.
 
     Represents an individual API call or usage event from Claude.
     """
 
-    model_config = ConfigDict(from_attributes=True)
-
     timestamp: datetime = Field(
         description="UTC timestamp when the usage event occurred"
     )
@@ -56,9 +70,10 @@ class UsageEntryResponse(BaseModel):
         description="Unique request identifier"
     )
 
-    @property
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
     def total_tokens(self) -> int:
-        """Calculate total tokens across all categories."""
+        """Total tokens across all categories, computed once per instance."""
         return (
             self.input_tokens
             + self.output_tokens
@@ -67,7 +82,7 @@ class UsageEntryResponse(BaseModel):
         )
 
 
-class TokenBreakdown(BaseModel):
+class TokenBreakdown(ResponseModel):
     """Breakdown of token usage by category."""
 
     input_tokens: int = Field(ge=0, default=0)
@@ -77,7 +92,7 @@ class TokenBreakdown(BaseModel):
     total_tokens: int = Field(ge=0, default=0)
 
 
-class DailyStatsResponse(BaseModel):
+class DailyStatsResponse(ResponseModel):
     """Response model for daily usage statistics.
 
     Provides aggregated statistics for a specific date.
@@ -101,13 +116,15 @@ class DailyStatsResponse(BaseModel):
         default_factory=list,
         description="List of unique models used"
     )
-    hourly_distribution: dict[int, int] = Field(
-        default_factory=dict,
-        description="Request count per hour (0-23)"
+    hourly_distribution: list[int] = Field(
+        default_factory=lambda: [0] * 24,
+        min_length=24,
+        max_length=24,
+        description="Request count per hour, indexed by hour of day (0-23)"
     )
 
 
-class SessionInfoResponse(BaseModel):
+class SessionInfoResponse(ResponseModel):
     """Response model for current session information.
 
     Tracks the 5-hour rolling window session state.
@@ -145,7 +162,7 @@ class SessionInfoResponse(BaseModel):
     )
 
 
-class BurnRateInfo(BaseModel):
+class BurnRateInfo(ResponseModel):
     """Information about current token consumption rate."""
 
     tokens_per_minute: float = Field(
@@ -160,7 +177,7 @@ class BurnRateInfo(BaseModel):
     )
 
 
-class RealtimeUsageResponse(BaseModel):
+class RealtimeUsageResponse(ResponseModel):
     """Response model for real-time usage data.
 
     Provides a comprehensive snapshot of current usage state.
@@ -186,7 +203,7 @@ class RealtimeUsageResponse(BaseModel):
     )
 
 
-class ModelStatsResponse(BaseModel):
+class ModelStatsResponse(ResponseModel):
     """Response model for per-model statistics."""
 
     model: str = Field(description="Model identifier")
@@ -208,7 +225,7 @@ class ModelStatsResponse(BaseModel):
     )
 
 
-class ProjectStatsResponse(BaseModel):
+class ProjectStatsResponse(ResponseModel):
     """Response model for per-project statistics."""
 
     project_path: str = Field(description="Project directory path")
@@ -222,7 +239,7 @@ class ProjectStatsResponse(BaseModel):
     )
 
 
-class HistoryResponse(BaseModel):
+class HistoryResponse(ResponseModel):
     """Response model for historical usage data."""
 
     days_requested: int = Field(ge=1, description="Number of days requested")
@@ -237,7 +254,7 @@ class HistoryResponse(BaseModel):
     )
 
 
-class ModelStatsListResponse(BaseModel):
+class ModelStatsListResponse(ResponseModel):
     """Response containing statistics for all models."""
 
     models: list[ModelStatsResponse] = Field(
@@ -254,7 +271,7 @@ class ModelStatsListResponse(BaseModel):
     )
 
 
-class ProjectStatsListResponse(BaseModel):
+class ProjectStatsListResponse(ResponseModel):
     """Response containing statistics for all projects."""
 
     projects: list[ProjectStatsResponse] = Field(
@@ -263,7 +280,7 @@ class ProjectStatsListResponse(BaseModel):
     total_projects: int = Field(ge=0, description="Number of unique projects")
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(ResponseModel):
     """Response model for health check endpoint."""
 
     status: str = Field(description="Service health status")
@@ -276,7 +293,7 @@ class HealthResponse(BaseModel):
     )
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(ResponseModel):
     """Standard error response model."""
 
     error: str = Field(description="Error type or code")
@@ -287,7 +304,7 @@ class ErrorResponse(BaseModel):
     )
 
 
-class PlanLimits(BaseModel):
+class PlanLimits(ResponseModel):
     """Plan limit configuration."""
 
     plan: str = Field(description="Plan name (pro, max5, max20, custom)")
@@ -297,7 +314,7 @@ class PlanLimits(BaseModel):
     message_limit: int = Field(ge=0, description="Message limit for the plan")
 
 
-class UsageVsLimit(BaseModel):
+class UsageVsLimit(ResponseModel):
     """Current usage compared to plan limits."""
 
     current: float = Field(description="Current usage value")
@@ -307,7 +324,7 @@ class UsageVsLimit(BaseModel):
     formatted_limit: str = Field(description="Formatted limit value")
 
 
-class ResetTimeInfo(BaseModel):
+class ResetTimeInfo(ResponseModel):
     """Information about when limits reset."""
 
     reset_time: datetime = Field(description="When limits will reset")
@@ -315,7 +332,7 @@ class ResetTimeInfo(BaseModel):
     remaining_formatted: str = Field(description="Human-readable remaining time")
 
 
-class PlanUsageResponse(BaseModel):
+class PlanUsageResponse(ResponseModel):
     """Complete plan usage status matching claude-monitor CLI output."""
 
     timestamp: datetime = Field(description="Timestamp of this snapshot")
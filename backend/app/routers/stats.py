@@ -6,8 +6,11 @@ broken down by model and project.
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import Response
 
+from app.core.errors import call_service
+from app.core.responses import model_response
 from app.models.schemas import (
     ErrorResponse,
     ModelStatsListResponse,
@@ -29,7 +32,7 @@ router = APIRouter(
 
 @router.get(
     "/models",
-    response_model=ModelStatsListResponse,
+    response_model=None,
     summary="Get Model Usage Statistics",
     description="""
     Retrieve usage statistics broken down by model.
@@ -45,6 +48,7 @@ router = APIRouter(
     """,
     responses={
         status.HTTP_200_OK: {
+            "model": ModelStatsListResponse,
             "description": "Model statistics retrieved successfully",
         },
     },
@@ -59,7 +63,7 @@ async def get_model_stats(
             description="Number of days to analyze (1-365)",
         ),
     ] = 30,
-) -> ModelStatsListResponse:
+) -> Response:
     """Get usage statistics grouped by model.
 
     Args:
@@ -67,23 +71,17 @@ async def get_model_stats(
         days: Number of days to analyze (1-365).
 
     Returns:
-        ModelStatsListResponse with per-model statistics.
+        JSON-encoded ModelStatsListResponse with per-model statistics.
 
     Raises:
         HTTPException: If data retrieval fails.
     """
-    try:
-        return data_service.get_model_stats(days)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve model stats: {str(e)}",
-        ) from e
+    return model_response(await call_service("model stats", data_service.get_model_stats, days))
 
 
 @router.get(
     "/projects",
-    response_model=ProjectStatsListResponse,
+    response_model=None,
     summary="Get Project Usage Statistics",
     description="""
     Retrieve usage statistics broken down by project.
@@ -99,28 +97,23 @@ async def get_model_stats(
     """,
     responses={
         status.HTTP_200_OK: {
+            "model": ProjectStatsListResponse,
             "description": "Project statistics retrieved successfully",
         },
     },
 )
 async def get_project_stats(
     data_service: Annotated[DataService, Depends(get_data_service)],
-) -> ProjectStatsListResponse:
+) -> Response:
     """Get usage statistics grouped by project.
 
     Args:
         data_service: Injected data service instance.
 
     Returns:
-        ProjectStatsListResponse with per-project statistics.
+        JSON-encoded ProjectStatsListResponse with per-project statistics.
 
     Raises:
         HTTPException: If data retrieval fails.
     """
-    try:
-        return data_service.get_project_stats()
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve project stats: {str(e)}",
-        ) from e
+    return model_response(await call_service("project stats", data_service.get_project_stats))
@@ -4,11 +4,14 @@ This module provides endpoints for retrieving usage data including
 real-time statistics, daily summaries, and historical trends.
 """
 
-from datetime import date, datetime
+from datetime import date
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 
+from app.core.errors import call_service
+from app.core.responses import model_response
 from app.models.schemas import (
     DailyStatsResponse,
     ErrorResponse,
@@ -32,7 +35,7 @@ router = APIRouter(
 
 @router.get(
     "/realtime",
-    response_model=RealtimeUsageResponse,
+    response_model=None,
     summary="Get Real-time Usage Data",
     description="""
     Retrieve comprehensive real-time usage data including:
@@ -46,36 +49,31 @@ router = APIRouter(
     """,
     responses={
         status.HTTP_200_OK: {
+            "model": RealtimeUsageResponse,
             "description": "Real-time usage data retrieved successfully",
         },
     },
 )
 async def get_realtime_usage(
     data_service: Annotated[DataService, Depends(get_data_service)],
-) -> RealtimeUsageResponse:
+) -> Response:
     """Get real-time usage data for dashboard display.
 
     Args:
         data_service: Injected data service instance.
 
     Returns:
-        RealtimeUsageResponse with current usage metrics.
+        JSON-encoded RealtimeUsageResponse with current usage metrics.
 
     Raises:
         HTTPException: If data retrieval fails.
     """
-    try:
-        return data_service.get_realtime_usage()
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve realtime usage: {str(e)}",
-        ) from e
+    return model_response(await call_service("realtime usage", data_service.get_realtime_usage))
 
 
 @router.get(
     "/daily",
-    response_model=DailyStatsResponse,
+    response_model=None,
     summary="Get Daily Usage Statistics",
     description="""
     Retrieve aggregated usage statistics for a specific date.
@@ -85,6 +83,7 @@ async def get_realtime_usage(
     """,
     responses={
         status.HTTP_200_OK: {
+            "model": DailyStatsResponse,
             "description": "Daily statistics retrieved successfully",
         },
         status.HTTP_400_BAD_REQUEST: {
@@ -103,7 +102,7 @@ async def get_daily_stats(
             examples=["2024-01-15"],
         ),
     ] = None,
-) -> DailyStatsResponse:
+) -> Response:
     """Get usage statistics for a specific date.
 
     Args:
@@ -111,7 +110,7 @@ async def get_daily_stats(
         target_date: Optional date string in YYYY-MM-DD format.
 
     Returns:
-        DailyStatsResponse with aggregated statistics.
+        JSON-encoded DailyStatsResponse with aggregated statistics.
 
     Raises:
         HTTPException: If date format is invalid or data retrieval fails.
@@ -120,25 +119,21 @@ async def get_daily_stats(
         query_date = date.today()
     else:
         try:
-            query_date = datetime.strptime(target_date, "%Y-%m-%d").date()
+            query_date = date.fromisoformat(target_date)
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid date format. Expected YYYY-MM-DD, got: {target_date}",
             ) from e
 
-    try:
-        return data_service.get_daily_stats(query_date)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve daily stats: {str(e)}",
-        ) from e
+    return model_response(
+        await call_service("daily stats", data_service.get_daily_stats, query_date)
+    )
 
 
 @router.get(
     "/history",
-    response_model=HistoryResponse,
+    response_model=None,
     summary="Get Historical Usage Data",
     description="""
     Retrieve historical usage data aggregated by day.
@@ -150,6 +145,7 @@ async def get_daily_stats(
     """,
     responses={
         status.HTTP_200_OK: {
+            "model": HistoryResponse,
             "description": "Historical data retrieved successfully",
         },
         status.HTTP_400_BAD_REQUEST: {
@@ -168,7 +164,7 @@ async def get_history(
             description="Number of days of history to retrieve (1-365)",
         ),
     ] = 30,
-) -> HistoryResponse:
+) -> Response:
     """Get historical usage data for the specified period.
 
     Args:
@@ -176,23 +172,17 @@ async def get_history(
         days: Number of days of history to retrieve (1-365).
 
     Returns:
-        HistoryResponse with daily statistics for the period.
+        JSON-encoded HistoryResponse with daily statistics for the period.
 
     Raises:
         HTTPException: If data retrieval fails.
     """
-    try:
-        return data_service.get_history(days)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve history: {str(e)}",
-        ) from e
+    return model_response(await call_service("history", data_service.get_history, days))
 
 
 @router.get(
     "/plan-usage",
-    response_model=PlanUsageResponse,
+    response_model=None,
     summary="Get Plan Usage vs Limits",
     description="""
     Retrieve current usage compared to plan limits.
@@ -210,6 +200,7 @@ async def get_history(
     """,
     responses={
         status.HTTP_200_OK: {
+            "model": PlanUsageResponse,
             "description": "Plan usage data retrieved successfully",
         },
     },
@@ -223,7 +214,7 @@ async def get_plan_usage(
             examples=["max20", "pro", "max5"],
         ),
     ] = "max20",
-) -> PlanUsageResponse:
+) -> Response:
     """Get current usage compared to plan limits.
 
     Args:
@@ -231,15 +222,9 @@ async def get_plan_usage(
         plan: Plan type to check usage against.
 
     Returns:
-        PlanUsageResponse with usage vs limits data.
+        JSON-encoded PlanUsageResponse with usage vs limits data.
 
     Raises:
         HTTPException: If data retrieval fails.
     """
-    try:
-        return data_service.get_plan_usage(plan)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve plan usage: {str(e)}",
-        ) from e
+    return model_response(await call_service("plan usage", data_service.get_plan_usage, plan))
@@ -5,21 +5,30 @@ real-time usage data to connected clients at regular intervals.
 """
 
 import asyncio
-import json
 import logging
 import secrets
+import time
+import zlib
 from datetime import datetime
 from datetime import timezone as tz
 
+import orjson
 from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
 
-from app.core.config import get_settings
+from app.core.config import SETTINGS
 from app.services.data_service import get_data_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["websocket"])
 
+# Maximum number of payloads queued per client before the oldest is dropped
+OUTBOUND_QUEUE_SIZE = 32
+
+# Subprotocol for clients that accept zlib-compressed binary payloads;
+# broadcasts are compressed once and shared by all such clients
+DEFLATE_SUBPROTOCOL = "usage-deflate-v1"
+
 
 def verify_websocket_token(token: str | None) -> bool:
     """Verify the WebSocket authentication token.
@@ -33,8 +42,7 @@ def verify_websocket_token(token: str | None) -> bool:
     Returns:
         True if authentication succeeds, False otherwise.
     """
-    settings = get_settings()
-    configured_key = settings.WEBSOCKET_API_KEY
+    configured_key = SETTINGS.WEBSOCKET_API_KEY
 
     # If no API key is configured, allow connections (development mode)
     if not configured_key:
@@ -48,17 +56,58 @@ def verify_websocket_token(token: str | None) -> bool:
     return secrets.compare_digest(token, configured_key)
 
 
+def encode_message(message: dict[str, object]) -> bytes:
+    """Serialize a message to JSON bytes with orjson.
+
+    datetime values are encoded natively, so callers can pass them
+    through without calling isoformat().
+
+    Args:
+        message: The message dictionary to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+
+
+async def send_payload(websocket: WebSocket, payload: bytes) -> None:
+    """Send an encoded JSON payload to a single client.
+
+    Uses a binary frame unless WEBSOCKET_BINARY_FRAMES is disabled,
+    in which case the payload is decoded and sent as a text frame.
+
+    Args:
+        websocket: The WebSocket connection to send to.
+        payload: The encoded JSON payload.
+    """
+    if SETTINGS.WEBSOCKET_BINARY_FRAMES:
+        await websocket.send_bytes(payload)
+    else:
+        await websocket.send_text(payload.decode())
+
+
 class ConnectionManager:
     """Manager for WebSocket connections.
 
     Handles connection lifecycle, message broadcasting,
     and graceful disconnection of clients.
+
+    Each connection has a bounded outbound queue drained by its own
+    sender task, so broadcasting never awaits a client. When a slow
+    client's queue is full, its oldest pending message is dropped.
+
+    Clients that negotiate DEFLATE_SUBPROTOCOL receive zlib-compressed
+    binary frames instead of plain JSON.
     """
 
     def __init__(self) -> None:
         """Initialize the connection manager."""
-        self._active_connections: set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+        self._active_connections: dict[WebSocket, asyncio.Queue[bytes]] = {}
+        self._sender_tasks: dict[WebSocket, asyncio.Task] = {}
+        self._compressed_connections: set[WebSocket] = set()
+        # (payload, compressed payload) of the last compressed broadcast
+        self._last_compressed: tuple[bytes, bytes] | None = None
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and register a new WebSocket connection.
@@ -66,25 +115,99 @@ class ConnectionManager:
         Args:
             websocket: The WebSocket connection to register.
         """
-        await websocket.accept()
-        async with self._lock:
-            self._active_connections.add(websocket)
+        compressed = DEFLATE_SUBPROTOCOL in websocket.scope.get("subprotocols", ())
+        await websocket.accept(subprotocol=DEFLATE_SUBPROTOCOL if compressed else None)
+        if compressed:
+            self._compressed_connections.add(websocket)
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+        self._active_connections[websocket] = queue
+        self._sender_tasks[websocket] = asyncio.create_task(
+            self._sender(websocket, queue, compressed)
+        )
         logger.info(
-            f"WebSocket connected. Active connections: {len(self._active_connections)}"
+            "WebSocket connected. Active connections: %d", len(self._active_connections)
         )
 
     async def disconnect(self, websocket: WebSocket) -> None:
-        """Remove a WebSocket connection from the active set.
+        """Remove a WebSocket connection and stop its sender task.
 
         Args:
             websocket: The WebSocket connection to remove.
         """
-        async with self._lock:
-            self._active_connections.discard(websocket)
+        self._active_connections.pop(websocket, None)
+        self._compressed_connections.discard(websocket)
+        task = self._sender_tasks.pop(websocket, None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
         logger.info(
-            f"WebSocket disconnected. Active connections: {len(self._active_connections)}"
+            "WebSocket disconnected. Active connections: %d", len(self._active_connections)
         )
 
+    async def _sender(
+        self,
+        websocket: WebSocket,
+        queue: asyncio.Queue[bytes],
+        compressed: bool,
+    ) -> None:
+        """Send queued payloads to a single client until it fails.
+
+        Args:
+            websocket: The WebSocket connection to send to.
+            queue: The connection's outbound payload queue.
+            compressed: Whether queued payloads are zlib-compressed.
+        """
+        while True:
+            payload = await queue.get()
+            try:
+                if compressed:
+                    await websocket.send_bytes(payload)
+                else:
+                    await send_payload(websocket, payload)
+            except Exception as e:
+                logger.warning(f"Failed to send to WebSocket: {e}")
+                await self.disconnect(websocket)
+                return
+
+    def _compress(self, payload: bytes) -> bytes:
+        """Compress a payload, reusing the last result for the same bytes.
+
+        Args:
+            payload: The encoded JSON payload.
+
+        Returns:
+            bytes: The zlib-compressed payload.
+        """
+        last = self._last_compressed
+        if last is not None and last[0] is payload:
+            return last[1]
+        compressed = zlib.compress(payload, 1)
+        self._last_compressed = (payload, compressed)
+        return compressed
+
+    @staticmethod
+    def _enqueue(queue: asyncio.Queue[bytes], payload: bytes) -> None:
+        """Queue a payload, dropping the oldest one if the queue is full."""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(payload)
+
+    def send(self, websocket: WebSocket, payload: bytes) -> None:
+        """Queue an encoded payload for a single client.
+
+        If the client's queue is full, the oldest queued payload is
+        dropped to make room.
+
+        Args:
+            websocket: The WebSocket connection to send to.
+            payload: The encoded JSON payload.
+        """
+        queue = self._active_connections.get(websocket)
+        if queue is None:
+            return
+        if websocket in self._compressed_connections:
+            payload = zlib.compress(payload, 1)
+        self._enqueue(queue, payload)
+
     async def broadcast(self, message: dict[str, object]) -> None:
         """Broadcast a message to all connected clients.
 
@@ -95,25 +218,22 @@ class ConnectionManager:
             return
 
         # Serialize once for all connections
-        json_message = json.dumps(message, default=str)
+        await self.broadcast_raw(encode_message(message))
 
-        # Create a copy of connections to iterate safely
-        async with self._lock:
-            connections = list(self._active_connections)
-
-        disconnected: set[WebSocket] = set()
-
-        for connection in connections:
-            try:
-                await connection.send_text(json_message)
-            except Exception as e:
-                logger.warning(f"Failed to send to WebSocket: {e}")
-                disconnected.add(connection)
+    async def broadcast_raw(self, payload: bytes) -> None:
+        """Broadcast an already-encoded payload to all connected clients.
 
-        # Clean up disconnected clients
-        if disconnected:
-            async with self._lock:
-                self._active_connections -= disconnected
+        Args:
+            payload: The encoded JSON payload to broadcast.
+        """
+        # Enqueueing never awaits, so the dict can't change mid-iteration
+        # and no snapshot copy or lock is needed
+        for websocket, queue in self._active_connections.items():
+            if websocket in self._compressed_connections:
+                # Compressed once per payload, shared by every such client
+                self._enqueue(queue, self._compress(payload))
+            else:
+                self._enqueue(queue, payload)
 
     @property
     def connection_count(self) -> int:
@@ -125,82 +245,101 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
-async def get_realtime_data() -> dict[str, object]:
+async def get_realtime_data(
+    fingerprint: tuple[int, int] | None = None,
+) -> dict[str, object]:
     """Fetch real-time usage data for broadcasting.
 
+    Args:
+        fingerprint: Data fingerprint already computed for this tick.
+
     Returns:
         Dictionary containing real-time usage data.
     """
     try:
         data_service = get_data_service()
-        realtime = data_service.get_realtime_usage()
+        # Load and aggregate in a worker thread to keep the event loop free
+        realtime = await asyncio.to_thread(data_service.get_realtime_usage, fingerprint)
 
-        # Convert to dictionary for JSON serialization
+        # Serialize in pydantic-core; recent entries are only sent as a count
         return {
             "type": "realtime_update",
-            "timestamp": realtime.timestamp.isoformat(),
-            "session": {
-                "session_start": (
-                    realtime.session.session_start.isoformat()
-                    if realtime.session.session_start
-                    else None
-                ),
-                "session_end": (
-                    realtime.session.session_end.isoformat()
-                    if realtime.session.session_end
-                    else None
-                ),
-                "remaining_minutes": realtime.session.remaining_minutes,
-                "remaining_formatted": realtime.session.remaining_formatted,
-                "is_active": realtime.session.is_active,
-                "tokens_in_window": realtime.session.tokens_in_window,
-                "cost_in_window": realtime.session.cost_in_window,
-            },
-            "today_stats": {
-                "date": realtime.today_stats.date,
-                "total_requests": realtime.today_stats.total_requests,
-                "tokens": {
-                    "input_tokens": realtime.today_stats.tokens.input_tokens,
-                    "output_tokens": realtime.today_stats.tokens.output_tokens,
-                    "cache_creation_tokens": realtime.today_stats.tokens.cache_creation_tokens,
-                    "cache_read_tokens": realtime.today_stats.tokens.cache_read_tokens,
-                    "total_tokens": realtime.today_stats.tokens.total_tokens,
-                },
-                "total_cost_usd": realtime.today_stats.total_cost_usd,
-                "models_used": realtime.today_stats.models_used,
-            },
-            "burn_rate": {
-                "tokens_per_minute": realtime.burn_rate.tokens_per_minute,
-                "cost_per_hour": realtime.burn_rate.cost_per_hour,
-            },
+            **realtime.model_dump(mode="json", exclude={"recent_entries"}),
             "recent_entries_count": len(realtime.recent_entries),
         }
     except Exception as e:
         logger.error(f"Error fetching realtime data: {e}")
         return {
             "type": "error",
-            "timestamp": datetime.now(tz.utc).isoformat(),
+            "timestamp": datetime.now(tz.utc),
             "error": str(e),
         }
 
 
+# Maximum age of a reused broadcast payload, as a fraction of the
+# broadcast interval. Staying under one interval means every tick sends
+# fresh time-derived fields (timestamp, remaining time, burn rate), while
+# on-demand requests between ticks can still reuse the last payload.
+PAYLOAD_MAX_AGE_FRACTION = 0.5
+
+# (data fingerprint, built at monotonic time, encoded payload)
+_payload_cache: tuple[tuple[int, int], float, bytes] | None = None
+
+
+async def get_broadcast_payload() -> bytes:
+    """Get the encoded realtime payload, reusing it while data is unchanged.
+
+    The usage files are fingerprinted by mtime and size; if they haven't
+    changed and the previous payload is younger than half a broadcast
+    interval, its bytes are reused instead of recomputing and re-encoding
+    the realtime data.
+
+    Returns:
+        bytes: The encoded realtime update (or error) message.
+    """
+    global _payload_cache
+    fingerprint = await asyncio.to_thread(get_data_service().get_data_fingerprint)
+    now = time.monotonic()
+    max_age = SETTINGS.WEBSOCKET_BROADCAST_INTERVAL * PAYLOAD_MAX_AGE_FRACTION
+
+    if _payload_cache is not None:
+        cached_fingerprint, built_at, cached_payload = _payload_cache
+        if cached_fingerprint == fingerprint and now - built_at < max_age:
+            return cached_payload
+
+    # Hand the fingerprint down so the data tree is only walked once per tick
+    data = await get_realtime_data(fingerprint)
+    payload = encode_message(data)
+    if data.get("type") != "error":
+        _payload_cache = (fingerprint, now, payload)
+    return payload
+
+
 async def broadcast_loop() -> None:
-    """Background task that broadcasts data at regular intervals."""
-    settings = get_settings()
-    interval = settings.WEBSOCKET_BROADCAST_INTERVAL
-
-    while True:
-        try:
-            if manager.connection_count > 0:
-                data = await get_realtime_data()
-                await manager.broadcast(data)
-            await asyncio.sleep(interval)
-        except asyncio.CancelledError:
-            logger.info("Broadcast loop cancelled")
-            break
-        except Exception as e:
-            logger.error(f"Error in broadcast loop: {e}")
-            await asyncio.sleep(interval)
+    """Background task that broadcasts data at regular intervals.
+
+    Ticks run on a fixed cadence: time spent building a payload comes out
+    of the following sleep instead of adding to it. Broadcasting only
+    enqueues, so sender tasks deliver one tick while the next is built.
+    """
+    interval = SETTINGS.WEBSOCKET_BROADCAST_INTERVAL
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+
+    try:
+        while True:
+            try:
+                if manager.connection_count > 0:
+                    payload = await get_broadcast_payload()
+                    await manager.broadcast_raw(payload)
+            except Exception as e:
+                logger.error(f"Error in broadcast loop: {e}")
+
+            # Skip missed ticks rather than bursting to catch up
+            next_tick = max(next_tick + interval, loop.time())
+            await asyncio.sleep(next_tick - loop.time())
+    except asyncio.CancelledError:
+        logger.info("Broadcast loop cancelled")
 
 
 # Background task reference
@@ -242,6 +381,8 @@ async def websocket_realtime(
     - On connection: Client receives immediate data snapshot
     - Every interval: Client receives updated data
     - Messages are JSON formatted
+    - Clients offering the "usage-deflate-v1" subprotocol receive each
+      message as a zlib-compressed binary frame
 
     Message types:
     - realtime_update: Regular data broadcast
@@ -263,15 +404,15 @@ async def websocket_realtime(
         # Send initial welcome message
         welcome = {
             "type": "welcome",
-            "timestamp": datetime.now(tz.utc).isoformat(),
+            "timestamp": datetime.now(tz.utc),
             "message": "Connected to Claude Usage Dashboard real-time feed",
-            "broadcast_interval_seconds": get_settings().WEBSOCKET_BROADCAST_INTERVAL,
+            "broadcast_interval_seconds": SETTINGS.WEBSOCKET_BROADCAST_INTERVAL,
         }
-        await websocket.send_json(welcome)
+        manager.send(websocket, encode_message(welcome))
 
         # Send immediate data snapshot
         initial_data = await get_realtime_data()
-        await websocket.send_json(initial_data)
+        manager.send(websocket, encode_message(initial_data))
 
         # Keep connection alive and handle incoming messages
         while True:
@@ -281,14 +422,14 @@ async def websocket_realtime(
 
                 # Handle ping/pong for connection keep-alive
                 if message == "ping":
-                    await websocket.send_json({
+                    manager.send(websocket, encode_message({
                         "type": "pong",
-                        "timestamp": datetime.now(tz.utc).isoformat(),
-                    })
+                        "timestamp": datetime.now(tz.utc),
+                    }))
                 elif message == "refresh":
                     # Client requested immediate refresh
                     data = await get_realtime_data()
-                    await websocket.send_json(data)
+                    manager.send(websocket, encode_message(data))
 
             except WebSocketDisconnect:
                 break
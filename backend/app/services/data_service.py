@@ -5,18 +5,28 @@ and the API endpoints, providing processed data in API-friendly formats.
 """
 
 import logging
+import os
 import time
+from bisect import bisect_left
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime, timedelta
 from datetime import timezone as tz
 from functools import lru_cache
+from operator import attrgetter
 from threading import Lock
+from typing import Any, NamedTuple
 
 from claude_monitor.core.models import CostMode, UsageEntry
 from claude_monitor.core.plans import Plans, PlanType
 from claude_monitor.data.analysis import analyze_usage
 from claude_monitor.data.reader import load_usage_entries
 
+try:
+    from ciso8601 import parse_datetime as _ciso_parse_datetime
+except ImportError:  # optional speedup, see the "speedups" extra
+    _ciso_parse_datetime = None  # type: ignore[assignment]
+
 from app.core.config import Settings, get_settings
 from app.models.schemas import (
     BurnRateInfo,
@@ -40,46 +50,402 @@ logger = logging.getLogger(__name__)
 # Cache TTL in seconds (10 seconds for real-time data)
 CACHE_TTL = 10
 
+# Maximum age of an analyze_usage result. Past it, the result is not
+# served while refreshes keep failing, since its active session block
+# may already have ended
+ANALYSIS_MAX_AGE = 60
+
+# Maximum age of loaded entries reused while the data files are unchanged,
+# bounding how far the hours_back cutoff can drift
+ENTRIES_CACHE_TTL = 60
+
+# Seconds a data fingerprint is reused before the data files are stat'ed
+# again, so frequent callers don't each walk the whole data tree
+FINGERPRINT_TTL = 2.0
+
+# Sort key of usage entries, which are loaded in timestamp order
+_entry_timestamp = attrgetter("timestamp")
+_entry_model = attrgetter("model")
+
+# Trailing window over which the realtime burn rate is measured
+BURN_RATE_WINDOW = timedelta(minutes=30)
+
+_ONE_HOUR = timedelta(hours=1)
+_ONE_DAY = timedelta(days=1)
+
+# Shared results for empty entry sets; response models are frozen
+_ZERO_TOKENS = TokenBreakdown()
+_ZERO_BURN_RATE = BurnRateInfo(tokens_per_minute=0.0, cost_per_hour=0.0)
+
 
 class CacheEntry:
     """Simple cache entry with TTL."""
 
+    __slots__ = ("data", "expires_at")
+
     def __init__(self, data: object, ttl: int = CACHE_TTL) -> None:
         self.data = data
-        self.expires_at = time.time() + ttl
+        self.expires_at = time.monotonic() + ttl
 
     def is_expired(self) -> bool:
-        return time.time() > self.expires_at
+        return time.monotonic() > self.expires_at
 
 
 class DataCache:
-    """Thread-safe in-memory cache with TTL."""
+    """Thread-safe in-memory cache with TTL.
+
+    The entries live in a dict that is never mutated once published;
+    writers build a new dict and swap the reference, which is atomic.
+    Readers therefore need no lock, and expired entries are simply
+    ignored on read and dropped on the next write.
+    """
 
     def __init__(self) -> None:
         self._cache: dict[str, CacheEntry] = {}
-        self._lock = Lock()
+        self._write_lock = Lock()
 
     def get(self, key: str) -> object | None:
-        with self._lock:
-            entry = self._cache.get(key)
-            if entry and not entry.is_expired():
-                return entry.data
-            elif entry:
-                del self._cache[key]
-            return None
+        entry = self._cache.get(key)
+        if entry is not None and not entry.is_expired():
+            return entry.data
+        return None
 
     def set(self, key: str, data: object, ttl: int = CACHE_TTL) -> None:
-        with self._lock:
-            self._cache[key] = CacheEntry(data, ttl)
+        with self._write_lock:
+            cache = {k: v for k, v in self._cache.items() if not v.is_expired()}
+            cache[key] = CacheEntry(data, ttl)
+            self._cache = cache
 
     def clear(self) -> None:
-        with self._lock:
-            self._cache.clear()
+        with self._write_lock:
+            self._cache = {}
 
 
 # Global cache instance
 _data_cache = DataCache()
 
+# Single worker for background analyze_usage refreshes
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analysis-refresh")
+
+
+class UsageRecord(NamedTuple):
+    """Compact copy of the UsageEntry fields the API aggregates.
+
+    Loaded entries stay cached for a while, so they are kept as tuples
+    rather than UsageEntry dataclasses, which each carry an instance
+    dict plus the unused project and source fields.
+    """
+
+    timestamp: datetime
+    input_tokens: int
+    output_tokens: int
+    cache_creation_tokens: int
+    cache_read_tokens: int
+    cost_usd: float
+    model: str
+    message_id: str
+    request_id: str
+
+
+def _to_records(entries: list[UsageEntry]) -> list[UsageRecord]:
+    """Convert loaded UsageEntry objects to compact records.
+
+    Model names repeat across nearly every entry, so each distinct name
+    is stored once and shared by all records that use it.
+
+    Args:
+        entries: Usage entries from the claude_monitor reader.
+
+    Returns:
+        List of UsageRecord in the same order.
+    """
+    models: dict[str, str] = {}
+    return [
+        UsageRecord(
+            e.timestamp,
+            e.input_tokens,
+            e.output_tokens,
+            e.cache_creation_tokens,
+            e.cache_read_tokens,
+            e.cost_usd,
+            models.setdefault(e.model, e.model),
+            e.message_id,
+            e.request_id,
+        )
+        for e in entries
+    ]
+
+
+def _run_end(entries: list[UsageRecord], boundary: datetime, start: int) -> int:
+    """Find where the run of sorted entries starting at ``start`` ends.
+
+    Args:
+        entries: Usage entries sorted by timestamp.
+        boundary: First timestamp past the end of the run.
+        start: Index of the first entry in the run.
+
+    Returns:
+        Index of the first entry at or after the boundary.
+    """
+    return bisect_left(entries, boundary, lo=start, key=_entry_timestamp)
+
+
+def _count_by_hour(
+    entries: list[UsageRecord],
+    hourly: list[int] | None = None,
+) -> list[int]:
+    """Count sorted entries per hour of the day.
+
+    Each hour is a contiguous run of the sorted entries, so only the
+    first entry of a run has its hour read; the rest of the run is
+    skipped by a binary search for the next hour boundary.
+
+    Args:
+        entries: Usage entries sorted by timestamp.
+        hourly: Optional 24-slot list to add the counts into in place.
+
+    Returns:
+        List of 24 entry counts indexed by hour.
+    """
+    if hourly is None:
+        hourly = [0] * 24
+    start = 0
+    while start < len(entries):
+        hour_start = entries[start].timestamp.replace(minute=0, second=0, microsecond=0)
+        end = _run_end(entries, hour_start + _ONE_HOUR, start)
+        hourly[hour_start.hour] += end - start
+        start = end
+    return hourly
+
+
+def _sum_usage(entries: list[UsageRecord]) -> tuple[int, float]:
+    """Sum the tokens and cost of entries in one pass.
+
+    Args:
+        entries: Usage entries to sum.
+
+    Returns:
+        Tuple of (total tokens across all categories, total cost).
+    """
+    tokens = 0
+    cost = 0.0
+    for e in entries:
+        tokens += (
+            e.input_tokens
+            + e.output_tokens
+            + e.cache_creation_tokens
+            + e.cache_read_tokens
+        )
+        cost += e.cost_usd
+    return tokens, cost
+
+
+def _split_by_day(entries: list[UsageRecord]) -> list[tuple[date, list[UsageRecord]]]:
+    """Split sorted entries into per-day runs.
+
+    Like ``_count_by_hour``, only the first entry of each day has its
+    date read; the day's end is found by binary search.
+
+    Args:
+        entries: Usage entries sorted by timestamp.
+
+    Returns:
+        List of (day, entries on that day) in date order.
+    """
+    runs: list[tuple[date, list[UsageRecord]]] = []
+    start = 0
+    while start < len(entries):
+        first = entries[start].timestamp
+        day_start = first.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = _run_end(entries, day_start + _ONE_DAY, start)
+        runs.append((first.date(), entries[start:end]))
+        start = end
+    return runs
+
+
+def _parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing "Z" for UTC.
+
+    Uses the ciso8601 C parser when it is installed, falling back to
+    ``datetime.fromisoformat``, which only accepts "Z" from Python 3.11.
+
+    Args:
+        value: ISO 8601 timestamp string.
+
+    Returns:
+        The parsed datetime.
+
+    Raises:
+        ValueError: If the string is not a valid timestamp.
+    """
+    if _ciso_parse_datetime is not None:
+        return _ciso_parse_datetime(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _parse_block_times(analysis_data: dict[str, Any]) -> None:
+    """Parse the start and end times of analyze_usage blocks in place.
+
+    The parsed datetimes are stored on each block as ``_startTime_dt`` and
+    ``_endTime_dt`` (None when the time is missing or unparseable), so a
+    cached analysis is parsed once rather than on every plan usage poll.
+
+    Args:
+        analysis_data: Result of ``analyze_usage``.
+    """
+    for block in analysis_data.get("blocks", []):
+        start_time_str = block.get("startTime", "")
+        end_time_str = block.get("endTime", "")
+        try:
+            block["_startTime_dt"] = (
+                _parse_iso_datetime(start_time_str) if start_time_str else None
+            )
+            block["_endTime_dt"] = (
+                _parse_iso_datetime(end_time_str) if end_time_str else None
+            )
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Failed to parse session times: {e}")
+            block["_startTime_dt"] = None
+            block["_endTime_dt"] = None
+
+
+def _format_clock(moment: datetime) -> str:
+    """Format a time on the 12-hour clock, e.g. "03:05 PM".
+
+    Matches ``strftime("%I:%M %p")`` without going through strftime's
+    format parsing on every call.
+
+    Args:
+        moment: The time to format.
+
+    Returns:
+        The zero-padded hour and minute with an AM/PM suffix.
+    """
+    hour = moment.hour
+    return f"{hour % 12 or 12:02d}:{moment.minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+@lru_cache(maxsize=32)
+def _format_plan_limits(
+    cost_limit: float,
+    token_limit: int,
+    message_limit: int,
+) -> tuple[str, str, str]:
+    """Get the display labels for a plan's limits, formatting them once.
+
+    Args:
+        cost_limit: Plan cost limit in USD.
+        token_limit: Plan token limit.
+        message_limit: Plan message limit.
+
+    Returns:
+        Tuple of (cost, token, message) limit labels.
+    """
+    return (
+        f"${cost_limit:.2f}",
+        f"{token_limit:,}",
+        str(message_limit),
+    )
+
+
+def _usage_vs_limit(
+    current: float,
+    limit: float,
+    formatted_current: str,
+    formatted_limit: str,
+) -> UsageVsLimit:
+    """Build a usage-vs-limit entry without validation.
+
+    The percentage is not capped at 100% so that overage shows.
+
+    Args:
+        current: Current usage value.
+        limit: Plan limit value; a non-positive limit gives 0%.
+        formatted_current: Display label for the current value.
+        formatted_limit: Display label for the limit.
+
+    Returns:
+        UsageVsLimit with the percentage rounded to one decimal.
+    """
+    return UsageVsLimit.model_construct(
+        current=current,
+        limit=limit,
+        percentage=round(current / limit * 100, 1) if limit > 0 else 0.0,
+        formatted_current=formatted_current,
+        formatted_limit=formatted_limit,
+    )
+
+
+class DailyTotals:
+    """Running usage totals for a single day.
+
+    Folds the token sums, cost and request count into one pass over the
+    entries; the model set is deduplicated in a single set update and the
+    hourly distribution is counted from the hour runs of the sorted
+    entries.
+    """
+
+    __slots__ = (
+        "input_tokens",
+        "output_tokens",
+        "cache_creation_tokens",
+        "cache_read_tokens",
+        "cost_usd",
+        "requests",
+        "models",
+        "hourly",
+    )
+
+    def __init__(self) -> None:
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_creation_tokens = 0
+        self.cache_read_tokens = 0
+        self.cost_usd = 0.0
+        self.requests = 0
+        self.models: set[str] = set()
+        self.hourly = [0] * 24
+
+    def add(self, entries: list[UsageRecord]) -> None:
+        """Fold a run of entries sorted by timestamp into the totals."""
+        for entry in entries:
+            self.input_tokens += entry.input_tokens
+            self.output_tokens += entry.output_tokens
+            self.cache_creation_tokens += entry.cache_creation_tokens
+            self.cache_read_tokens += entry.cache_read_tokens
+            self.cost_usd += entry.cost_usd
+        self.requests += len(entries)
+        # Deduplicate model names in one C-level set update, skipping
+        # entries without a model
+        self.models.update(filter(None, map(_entry_model, entries)))
+        _count_by_hour(entries, self.hourly)
+
+    def to_response(self, day: date) -> DailyStatsResponse:
+        """Build the DailyStatsResponse for this day without validation."""
+        if self.requests:
+            tokens = TokenBreakdown.model_construct(
+                input_tokens=self.input_tokens,
+                output_tokens=self.output_tokens,
+                cache_creation_tokens=self.cache_creation_tokens,
+                cache_read_tokens=self.cache_read_tokens,
+                total_tokens=(
+                    self.input_tokens
+                    + self.output_tokens
+                    + self.cache_creation_tokens
+                    + self.cache_read_tokens
+                ),
+            )
+        else:
+            tokens = _ZERO_TOKENS
+        return DailyStatsResponse.model_construct(
+            date=day.isoformat(),
+            total_requests=self.requests,
+            tokens=tokens,
+            total_cost_usd=self.cost_usd,
+            models_used=list(self.models),
+            hourly_distribution=self.hourly,
+        )
+
 
 class DataService:
     """Service for reading and processing Claude usage data.
@@ -90,6 +456,9 @@ class DataService:
     Attributes:
         settings: Application settings instance.
         session_window_hours: Duration of the rolling session window.
+        session_window: The session window as a timedelta, computed once.
+        data_path: Expanded Claude data directory, computed once.
+        realtime_cache_ttl: Seconds a realtime usage snapshot is reused.
     """
 
     def __init__(self, settings: Settings | None = None) -> None:
@@ -100,47 +469,124 @@ class DataService:
         """
         self.settings = settings or get_settings()
         self.session_window_hours = self.settings.SESSION_WINDOW_HOURS
+        self.session_window = timedelta(hours=self.session_window_hours)
+        self.data_path = str(self.settings.get_data_path())
+        self.realtime_cache_ttl = self.settings.REALTIME_CACHE_TTL
+        # (built at monotonic time, data fingerprint, response)
+        self._realtime_cache: (
+            tuple[float, tuple[int, int], RealtimeUsageResponse] | None
+        ) = None
+        self._realtime_lock = Lock()
+        # (expires at monotonic time, fingerprint) from the last data walk
+        self._fingerprint: tuple[float, tuple[int, int]] | None = None
+        # (built at monotonic time, analysis) from analyze_usage
+        self._analysis: tuple[float, dict[str, Any]] | None = None
+        self._analysis_lock = Lock()
+        self._refresh_future: Future[None] | None = None
+        self._refresh_lock = Lock()
+
+    def get_data_fingerprint(self) -> tuple[int, int]:
+        """Get a cheap fingerprint of the usage data files.
+
+        Only stats the files, so it is far cheaper than reloading them
+        and can be used to detect whether any data has changed. The walk
+        still visits the whole data tree, so its result is reused for
+        FINGERPRINT_TTL seconds.
+
+        Returns:
+            Tuple of (latest mtime in ns, total size in bytes) across
+            all JSONL files under the data path.
+        """
+        now = time.monotonic()
+        cached = self._fingerprint
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
+        latest_mtime = 0
+        total_size = 0
+        for root, _, files in os.walk(self.data_path):
+            for name in files:
+                if not name.endswith(".jsonl"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    continue
+                latest_mtime = max(latest_mtime, stat.st_mtime_ns)
+                total_size += stat.st_size
+
+        fingerprint = (latest_mtime, total_size)
+        self._fingerprint = (now + FINGERPRINT_TTL, fingerprint)
+        return fingerprint
 
     def _load_entries(
         self,
         hours_back: int | None = None,
-    ) -> list[UsageEntry]:
+        fingerprint: tuple[int, int] | None = None,
+    ) -> list[UsageRecord]:
         """Load usage entries from the claude_monitor data reader.
 
+        The widest window loaded so far is memoized together with the data
+        fingerprint. Narrower windows are sliced out of it by timestamp, so
+        the JSONL files are only re-read once they change or a wider window
+        is requested.
+
         Args:
             hours_back: Optional limit to entries from last N hours.
+            fingerprint: Data fingerprint the caller already computed;
+                taken from get_data_fingerprint when omitted.
 
         Returns:
-            List of UsageEntry objects sorted by timestamp.
+            List of UsageRecord objects sorted by timestamp.
         """
-        cache_key = f"entries_{hours_back}"
-        cached = _data_cache.get(cache_key)
+        if fingerprint is None:
+            fingerprint = self.get_data_fingerprint()
+        cached = _data_cache.get("entries")
         if cached is not None:
-            return cached
+            cached_fingerprint, cached_hours, entries = cached
+            if cached_fingerprint == fingerprint:
+                if hours_back == cached_hours:
+                    return entries
+                if cached_hours is None or (
+                    hours_back is not None and hours_back < cached_hours
+                ):
+                    cutoff = datetime.now(tz.utc) - timedelta(hours=hours_back)
+                    return entries[self._window_start_index(entries, cutoff):]
 
         try:
-            entries, _ = load_usage_entries(
-                data_path=self.settings.CLAUDE_DATA_PATH,
+            loaded, _ = load_usage_entries(
+                data_path=self.data_path,
                 hours_back=hours_back,
                 mode=CostMode.AUTO,
                 include_raw=False,
             )
-            _data_cache.set(cache_key, entries)
+            # Only the compact records are cached; the UsageEntry objects
+            # are dropped as soon as they have been converted
+            entries = _to_records(loaded)
+            del loaded
+            # Every aggregation relies on timestamp order. The reader
+            # already sorts, so this is a linear pass that keeps the
+            # invariant should that ever change.
+            entries.sort(key=_entry_timestamp)
+            _data_cache.set(
+                "entries", (fingerprint, hours_back, entries), ENTRIES_CACHE_TTL
+            )
             return entries
         except Exception as e:
             logger.error(f"Failed to load usage entries: {e}")
             return []
 
-    def _entry_to_response(self, entry: UsageEntry) -> UsageEntryResponse:
-        """Convert a UsageEntry to a UsageEntryResponse.
+    def _entry_to_response(self, entry: UsageRecord) -> UsageEntryResponse:
+        """Convert a loaded usage record to a UsageEntryResponse.
 
         Args:
-            entry: The UsageEntry from claude_monitor.
+            entry: The usage record from ``_load_entries``.
 
         Returns:
             UsageEntryResponse suitable for API responses.
         """
-        return UsageEntryResponse(
+        # Record fields already have the response types, so skip validation
+        return UsageEntryResponse.model_construct(
             timestamp=entry.timestamp,
             input_tokens=entry.input_tokens,
             output_tokens=entry.output_tokens,
@@ -152,35 +598,149 @@ class DataService:
             request_id=entry.request_id,
         )
 
-    def _calculate_token_breakdown(
+    def _entries_to_response(
         self,
-        entries: list[UsageEntry],
-    ) -> TokenBreakdown:
-        """Calculate aggregated token breakdown from entries.
+        entries: list[UsageRecord],
+    ) -> list[UsageEntryResponse]:
+        """Convert a batch of usage records to UsageEntryResponses.
+
+        Args:
+            entries: The usage records from ``_load_entries``.
+
+        Returns:
+            List of UsageEntryResponse in the same order.
+        """
+        to_response = self._entry_to_response
+        return [to_response(entry) for entry in entries]
+
+    def _calculate_totals(
+        self,
+        entries: list[UsageRecord],
+    ) -> tuple[TokenBreakdown, float]:
+        """Aggregate token counts and cost from entries in a single pass.
 
         Args:
             entries: List of usage entries to aggregate.
 
         Returns:
-            TokenBreakdown with summed token counts.
+            Tuple of (TokenBreakdown with summed token counts, total cost).
         """
-        input_tokens = sum(e.input_tokens for e in entries)
-        output_tokens = sum(e.output_tokens for e in entries)
-        cache_creation = sum(e.cache_creation_tokens for e in entries)
-        cache_read = sum(e.cache_read_tokens for e in entries)
+        if not entries:
+            return _ZERO_TOKENS, 0.0
+
+        input_tokens = output_tokens = cache_creation = cache_read = 0
+        cost = 0.0
+        for e in entries:
+            input_tokens += e.input_tokens
+            output_tokens += e.output_tokens
+            cache_creation += e.cache_creation_tokens
+            cache_read += e.cache_read_tokens
+            cost += e.cost_usd
         total = input_tokens + output_tokens + cache_creation + cache_read
 
-        return TokenBreakdown(
+        tokens = TokenBreakdown.model_construct(
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             cache_creation_tokens=cache_creation,
             cache_read_tokens=cache_read,
             total_tokens=total,
         )
+        return tokens, cost
+
+    def _calculate_token_breakdown(
+        self,
+        entries: list[UsageRecord],
+    ) -> TokenBreakdown:
+        """Calculate aggregated token breakdown from entries.
+
+        Args:
+            entries: List of usage entries to aggregate.
+
+        Returns:
+            TokenBreakdown with summed token counts.
+        """
+        return self._calculate_totals(entries)[0]
+
+    def _window_start_index(
+        self,
+        entries: list[UsageRecord],
+        window_start: datetime,
+    ) -> int:
+        """Find the first entry at or after the start of a time window.
+
+        Entries are sorted by timestamp, so this is a binary search
+        rather than a scan of every entry.
+
+        Args:
+            entries: Usage entries sorted by timestamp.
+            window_start: Start of the time window.
+
+        Returns:
+            Index of the first entry within the window.
+        """
+        return bisect_left(entries, window_start, key=_entry_timestamp)
+
+    def _window_totals(
+        self,
+        entries: list[UsageRecord],
+        window_start: datetime,
+    ) -> tuple[int, float, datetime | None]:
+        """Sum tokens and cost of the entries in a time window in one pass.
+
+        Args:
+            entries: Usage entries sorted by timestamp.
+            window_start: Start of the time window.
+
+        Returns:
+            Tuple of (total tokens, total cost, timestamp of the first
+            entry in the window or None if the window is empty).
+        """
+        start = self._window_start_index(entries, window_start)
+        if start == len(entries):
+            return 0, 0.0, None
+
+        tokens, cost = _sum_usage(entries[start:])
+        return tokens, cost, entries[start].timestamp
+
+    def _nested_window_totals(
+        self,
+        entries: list[UsageRecord],
+        window_start: datetime,
+        inner_start: datetime,
+    ) -> tuple[tuple[int, float, datetime | None], tuple[int, float, datetime | None]]:
+        """Sum a time window and a later window nested inside it in one pass.
+
+        Each entry is visited once: the outer window's totals are those of
+        the inner window plus the entries before it.
+
+        Args:
+            entries: Usage entries sorted by timestamp.
+            window_start: Start of the outer time window.
+            inner_start: Start of the inner window, no earlier than
+                window_start.
+
+        Returns:
+            Tuples of (total tokens, total cost, first timestamp or None)
+            for the outer and the inner window, as from _window_totals.
+        """
+        start = self._window_start_index(entries, window_start)
+        inner = max(start, self._window_start_index(entries, inner_start))
+
+        inner_tokens, inner_cost = _sum_usage(entries[inner:])
+        head_tokens, head_cost = _sum_usage(entries[start:inner])
+
+        def first(index: int) -> datetime | None:
+            return entries[index].timestamp if index < len(entries) else None
+
+        return (
+            (head_tokens + inner_tokens, head_cost + inner_cost, first(start)),
+            (inner_tokens, inner_cost, first(inner)),
+        )
 
     def _calculate_session_info(
         self,
-        entries: list[UsageEntry],
+        entries: list[UsageRecord],
+        now: datetime | None = None,
     ) -> SessionInfoResponse:
         """Calculate current session information based on rolling window.
 
@@ -189,19 +749,41 @@ class DataService:
         session is considered inactive.
 
         Args:
-            entries: All available usage entries.
+            entries: All available usage entries, sorted by timestamp.
+            now: Current time; defaults to now. Passed in so a snapshot's
+                metrics are computed against the same instant.
 
         Returns:
             SessionInfoResponse with current session state.
         """
-        now = datetime.now(tz.utc)
-        window_start = now - timedelta(hours=self.session_window_hours)
+        if now is None:
+            now = datetime.now(tz.utc)
+        window_start = now - self.session_window
 
-        # Filter entries within the session window
-        window_entries = [e for e in entries if e.timestamp >= window_start]
+        # Calculate totals in window
+        tokens, cost, first_timestamp = self._window_totals(entries, window_start)
+        return self._session_info_from_totals(tokens, cost, first_timestamp, now)
+
+    def _session_info_from_totals(
+        self,
+        tokens: int,
+        cost: float,
+        first_timestamp: datetime | None,
+        now: datetime,
+    ) -> SessionInfoResponse:
+        """Build the session info from the session window's totals.
 
-        if not window_entries:
-            return SessionInfoResponse(
+        Args:
+            tokens: Total tokens in the session window.
+            cost: Total cost in the session window.
+            first_timestamp: First entry in the window, or None if empty.
+            now: Current time.
+
+        Returns:
+            SessionInfoResponse with current session state.
+        """
+        if first_timestamp is None:
+            return SessionInfoResponse.model_construct(
                 session_start=None,
                 session_end=None,
                 remaining_minutes=0.0,
@@ -212,11 +794,10 @@ class DataService:
             )
 
         # Session starts from the first entry in the window
-        first_entry = min(window_entries, key=lambda e: e.timestamp)
-        session_start = first_entry.timestamp
+        session_start = first_timestamp
 
         # Session ends 5 hours after the first entry
-        session_end = session_start + timedelta(hours=self.session_window_hours)
+        session_end = session_start + self.session_window
 
         # Calculate remaining time
         remaining = session_end - now
@@ -233,17 +814,7 @@ class DataService:
             else:
                 remaining_formatted = f"{minutes}m"
 
-        # Calculate totals in window
-        tokens = sum(
-            e.input_tokens
-            + e.output_tokens
-            + e.cache_creation_tokens
-            + e.cache_read_tokens
-            for e in window_entries
-        )
-        cost = sum(e.cost_usd for e in window_entries)
-
-        return SessionInfoResponse(
+        return SessionInfoResponse.model_construct(
             session_start=session_start,
             session_end=session_end,
             remaining_minutes=remaining_minutes,
@@ -255,86 +826,88 @@ class DataService:
 
     def _calculate_burn_rate(
         self,
-        entries: list[UsageEntry],
+        entries: list[UsageRecord],
         minutes_window: int = 30,
+        now: datetime | None = None,
     ) -> BurnRateInfo:
         """Calculate current token consumption rate.
 
         Args:
-            entries: Recent usage entries.
+            entries: Recent usage entries, sorted by timestamp.
             minutes_window: Time window for rate calculation.
+            now: Current time; defaults to now.
 
         Returns:
             BurnRateInfo with consumption metrics.
         """
-        now = datetime.now(tz.utc)
+        if now is None:
+            now = datetime.now(tz.utc)
         window_start = now - timedelta(minutes=minutes_window)
 
-        recent_entries = [e for e in entries if e.timestamp >= window_start]
+        total_tokens, total_cost, first_timestamp = self._window_totals(
+            entries, window_start
+        )
+        return self._burn_rate_from_totals(total_tokens, total_cost, first_timestamp, now)
 
-        if not recent_entries:
-            return BurnRateInfo(tokens_per_minute=0.0, cost_per_hour=0.0)
+    def _burn_rate_from_totals(
+        self,
+        total_tokens: int,
+        total_cost: float,
+        first_timestamp: datetime | None,
+        now: datetime,
+    ) -> BurnRateInfo:
+        """Build the burn rate from the rate window's totals.
 
-        total_tokens = sum(
-            e.input_tokens
-            + e.output_tokens
-            + e.cache_creation_tokens
-            + e.cache_read_tokens
-            for e in recent_entries
-        )
-        total_cost = sum(e.cost_usd for e in recent_entries)
+        Args:
+            total_tokens: Total tokens in the rate window.
+            total_cost: Total cost in the rate window.
+            first_timestamp: First entry in the window, or None if empty.
+            now: Current time.
+
+        Returns:
+            BurnRateInfo with consumption metrics.
+        """
+        if first_timestamp is None:
+            return _ZERO_BURN_RATE
 
         # Calculate actual time span
-        first_entry = min(recent_entries, key=lambda e: e.timestamp)
-        time_span = (now - first_entry.timestamp).total_seconds() / 60
+        time_span = (now - first_timestamp).total_seconds() / 60
         time_span = max(time_span, 1.0)  # Avoid division by zero
 
         tokens_per_minute = total_tokens / time_span
         cost_per_hour = (total_cost / time_span) * 60
 
-        return BurnRateInfo(
+        return BurnRateInfo.model_construct(
             tokens_per_minute=round(tokens_per_minute, 2),
             cost_per_hour=round(cost_per_hour, 4),
         )
 
-    def get_today_stats(self) -> DailyStatsResponse:
+    def get_today_stats(
+        self,
+        entries: list[UsageRecord] | None = None,
+    ) -> DailyStatsResponse:
         """Get aggregated statistics for today.
 
+        Args:
+            entries: Optional already-loaded entries covering at least the
+                last 24 hours. Loaded from disk when omitted.
+
         Returns:
             DailyStatsResponse with today's usage statistics.
         """
-        entries = self._load_entries(hours_back=24)
+        if entries is None:
+            entries = self._load_entries(hours_back=24)
         today = date.today()
 
-        # Filter to only today's entries (in local time)
-        today_entries = [
-            e
-            for e in entries
-            if e.timestamp.date() == today
-            or (
-                e.timestamp.astimezone().date() == today
-                if e.timestamp.tzinfo
-                else e.timestamp.date() == today
-            )
-        ]
-
-        tokens = self._calculate_token_breakdown(today_entries)
-        models = list({e.model for e in today_entries if e.model})
-
-        # Calculate hourly distribution
-        hourly: dict[int, int] = defaultdict(int)
-        for entry in today_entries:
-            hour = entry.timestamp.hour
-            hourly[hour] += 1
+        # Today's entries are those dated today in either UTC or local
+        # time. Entries are sorted, so they form the tail that starts at
+        # the earlier of today's UTC and local midnights.
+        midnight = datetime.combine(today, datetime.min.time())
+        start = min(midnight.replace(tzinfo=tz.utc), midnight.astimezone())
+        totals = DailyTotals()
+        totals.add(entries[self._window_start_index(entries, start):])
 
-        return DailyStatsResponse(
-            date=today.isoformat(),
-            total_requests=len(today_entries),
-            tokens=tokens,
-            total_cost_usd=sum(e.cost_usd for e in today_entries),
-            models_used=models,
-            hourly_distribution=dict(hourly),
-        )
+        return totals.to_response(today)
 
     def get_daily_stats(self, target_date: date) -> DailyStatsResponse:
         """Get aggregated statistics for a specific date.
@@ -351,24 +924,15 @@ class DataService:
 
         entries = self._load_entries(hours_back=hours_back)
 
-        # Filter to target date
-        date_entries = [e for e in entries if e.timestamp.date() == target_date]
-
-        tokens = self._calculate_token_breakdown(date_entries)
-        models = list({e.model for e in date_entries if e.model})
-
-        hourly: dict[int, int] = defaultdict(int)
-        for entry in date_entries:
-            hourly[entry.timestamp.hour] += 1
+        # Entries are sorted, so the target date is the run between its
+        # UTC midnight and the next one
+        start = datetime.combine(target_date, datetime.min.time(), tzinfo=tz.utc)
+        first = self._window_start_index(entries, start)
+        last = self._window_start_index(entries, start + timedelta(days=1))
+        totals = DailyTotals()
+        totals.add(entries[first:last])
 
-        return DailyStatsResponse(
-            date=target_date.isoformat(),
-            total_requests=len(date_entries),
-            tokens=tokens,
-            total_cost_usd=sum(e.cost_usd for e in date_entries),
-            models_used=models,
-            hourly_distribution=dict(hourly),
-        )
+        return totals.to_response(target_date)
 
     def get_history(self, days: int = 30) -> HistoryResponse:
         """Get historical usage data for the specified number of days.
@@ -381,32 +945,14 @@ class DataService:
         """
         entries = self._load_entries(hours_back=days * 24)
 
-        # Group entries by date
-        by_date: dict[date, list[UsageEntry]] = defaultdict(list)
-        for entry in entries:
-            by_date[entry.timestamp.date()].append(entry)
-
-        # Build daily stats
+        # Entries are sorted by timestamp, so each day is one contiguous
+        # run; aggregate the runs without reading every entry's date.
+        # The totals are computed here, so the rows skip validation.
         daily_stats: list[DailyStatsResponse] = []
-        for day in sorted(by_date.keys()):
-            day_entries = by_date[day]
-            tokens = self._calculate_token_breakdown(day_entries)
-            models = list({e.model for e in day_entries if e.model})
-
-            hourly: dict[int, int] = defaultdict(int)
-            for entry in day_entries:
-                hourly[entry.timestamp.hour] += 1
-
-            daily_stats.append(
-                DailyStatsResponse(
-                    date=day.isoformat(),
-                    total_requests=len(day_entries),
-                    tokens=tokens,
-                    total_cost_usd=sum(e.cost_usd for e in day_entries),
-                    models_used=models,
-                    hourly_distribution=dict(hourly),
-                )
-            )
+        for day, day_entries in _split_by_day(entries):
+            totals = DailyTotals()
+            totals.add(day_entries)
+            daily_stats.append(totals.to_response(day))
 
         total_tokens = sum(ds.tokens.total_tokens for ds in daily_stats)
         total_cost = sum(ds.total_cost_usd for ds in daily_stats)
@@ -416,7 +962,7 @@ class DataService:
             "end": daily_stats[-1].date if daily_stats else None,
         }
 
-        return HistoryResponse(
+        return HistoryResponse.model_construct(
             days_requested=days,
             days_with_data=len(daily_stats),
             daily_stats=daily_stats,
@@ -437,7 +983,7 @@ class DataService:
         entries = self._load_entries(hours_back=days * 24)
 
         if not entries:
-            return ModelStatsListResponse(
+            return ModelStatsListResponse.model_construct(
                 models=[],
                 total_models=0,
                 period_start=None,
@@ -445,53 +991,51 @@ class DataService:
             )
 
         # Group by model
-        by_model: dict[str, list[UsageEntry]] = defaultdict(list)
+        by_model: dict[str, list[UsageRecord]] = defaultdict(list)
         for entry in entries:
             model_key = entry.model or "unknown"
             by_model[model_key].append(entry)
 
+        model_totals = {
+            model: self._calculate_totals(model_entries)
+            for model, model_entries in by_model.items()
+        }
+
         # Calculate total tokens for percentage calculation
         total_all_tokens = sum(
-            e.input_tokens
-            + e.output_tokens
-            + e.cache_creation_tokens
-            + e.cache_read_tokens
-            for e in entries
+            tokens.total_tokens for tokens, _ in model_totals.values()
         )
 
         model_stats: list[ModelStatsResponse] = []
         for model, model_entries in by_model.items():
-            tokens = self._calculate_token_breakdown(model_entries)
+            tokens, cost = model_totals[model]
             percentage = (
                 (tokens.total_tokens / total_all_tokens * 100)
                 if total_all_tokens > 0
                 else 0.0
             )
 
-            sorted_entries = sorted(model_entries, key=lambda e: e.timestamp)
-
+            # Entries are sorted by timestamp, so each model's entries are too
             model_stats.append(
-                ModelStatsResponse(
+                ModelStatsResponse.model_construct(
                     model=model,
                     total_requests=len(model_entries),
                     tokens=tokens,
-                    total_cost_usd=sum(e.cost_usd for e in model_entries),
+                    total_cost_usd=cost,
                     percentage_of_total=round(percentage, 2),
-                    first_used=sorted_entries[0].timestamp if sorted_entries else None,
-                    last_used=sorted_entries[-1].timestamp if sorted_entries else None,
+                    first_used=model_entries[0].timestamp,
+                    last_used=model_entries[-1].timestamp,
                 )
             )
 
         # Sort by total tokens descending
         model_stats.sort(key=lambda m: m.tokens.total_tokens, reverse=True)
 
-        sorted_entries = sorted(entries, key=lambda e: e.timestamp)
-
-        return ModelStatsListResponse(
+        return ModelStatsListResponse.model_construct(
             models=model_stats,
             total_models=len(model_stats),
-            period_start=sorted_entries[0].timestamp if sorted_entries else None,
-            period_end=sorted_entries[-1].timestamp if sorted_entries else None,
+            period_start=entries[0].timestamp,
+            period_end=entries[-1].timestamp,
         )
 
     def get_project_stats(self) -> ProjectStatsListResponse:
@@ -506,38 +1050,158 @@ class DataService:
         # Project stats would require access to file paths which
         # are not exposed by the current load_usage_entries API.
         # This returns empty for now but the structure is in place.
-        return ProjectStatsListResponse(
+        return ProjectStatsListResponse.model_construct(
             projects=[],
             total_projects=0,
         )
 
-    def get_realtime_usage(self) -> RealtimeUsageResponse:
+    def get_realtime_usage(
+        self, fingerprint: tuple[int, int] | None = None
+    ) -> RealtimeUsageResponse:
         """Get comprehensive real-time usage data.
 
+        The snapshot is reused for REALTIME_CACHE_TTL seconds while the
+        data files are unchanged. Concurrent callers wait for a single
+        computation instead of each building their own.
+
+        Args:
+            fingerprint: Data fingerprint the caller already computed;
+                taken from get_data_fingerprint when omitted.
+
+        Returns:
+            RealtimeUsageResponse with all current usage metrics.
+        """
+        if fingerprint is None:
+            fingerprint = self.get_data_fingerprint()
+
+        with self._realtime_lock:
+            now = time.monotonic()
+            cached = self._realtime_cache
+            if cached is not None:
+                built_at, cached_fingerprint, response = cached
+                if (
+                    cached_fingerprint == fingerprint
+                    and now - built_at < self.realtime_cache_ttl
+                ):
+                    return response
+
+            response = self._build_realtime_usage(fingerprint)
+            self._realtime_cache = (now, fingerprint, response)
+            return response
+
+    def _build_realtime_usage(
+        self, fingerprint: tuple[int, int] | None = None
+    ) -> RealtimeUsageResponse:
+        """Compute real-time usage data from the usage entries.
+
+        Args:
+            fingerprint: Data fingerprint already computed by the caller.
+
         Returns:
             RealtimeUsageResponse with all current usage metrics.
         """
-        # Load entries for session window plus some buffer
-        entries = self._load_entries(hours_back=self.session_window_hours + 1)
+        # Load one superset covering both today and the session window
+        # plus some buffer, so today's stats don't trigger a second load
+        window_hours = self.session_window_hours + 1
+        all_entries = self._load_entries(
+            hours_back=max(24, window_hours), fingerprint=fingerprint
+        )
+        now = datetime.now(tz.utc)
+        window_start = now - timedelta(hours=window_hours)
+        entries = all_entries[self._window_start_index(all_entries, window_start):]
 
-        session_info = self._calculate_session_info(entries)
-        today_stats = self.get_today_stats()
-        burn_rate = self._calculate_burn_rate(entries)
+        # The burn-rate window lies inside the session window, so both are
+        # summed in one pass
+        session_totals, burn_totals = self._nested_window_totals(
+            entries, now - self.session_window, now - BURN_RATE_WINDOW
+        )
+        session_info = self._session_info_from_totals(*session_totals, now)
+        burn_rate = self._burn_rate_from_totals(*burn_totals, now)
+        today_stats = self.get_today_stats(entries=all_entries)
 
-        # Get recent entries (last 50)
-        sorted_entries = sorted(entries, key=lambda e: e.timestamp, reverse=True)
-        recent_entries = [
-            self._entry_to_response(e) for e in sorted_entries[:50]
-        ]
+        # Entries are sorted, so the last 50 are the most recent, newest first
+        recent_entries = self._entries_to_response(entries[-50:][::-1])
 
-        return RealtimeUsageResponse(
-            timestamp=datetime.now(tz.utc),
+        return RealtimeUsageResponse.model_construct(
+            timestamp=now,
             session=session_info,
             today_stats=today_stats,
             burn_rate=burn_rate,
             recent_entries=recent_entries,
         )
 
+    def _analyze_usage(self) -> dict[str, Any] | None:
+        """Run analyze_usage over the last two session windows.
+
+        Returns:
+            The analysis with its block times parsed, or None on failure.
+        """
+        try:
+            analysis_data = analyze_usage(
+                hours_back=self.session_window_hours * 2,  # Look back 2 windows
+                quick_start=True,   # Like CLI - faster startup
+                use_cache=True,     # Like CLI - use built-in cache
+                data_path=self.data_path,
+            )
+        except Exception as e:
+            logger.error(f"Failed to analyze usage: {e}")
+            return None
+        if analysis_data:
+            _parse_block_times(analysis_data)
+        return analysis_data
+
+    def _refresh_analysis(self) -> None:
+        """Recompute the cached analysis, keeping the old one on failure."""
+        analysis_data = self._analyze_usage()
+        if analysis_data is not None:
+            self._analysis = (time.monotonic(), analysis_data)
+
+    def _get_analysis(self) -> dict[str, Any] | None:
+        """Get the analyze_usage result, refreshing it off the request path.
+
+        analyze_usage is the most expensive operation, so only the first
+        call computes it inline, and concurrent first callers wait for
+        that one computation. Once the result is older than CACHE_TTL it
+        is still served while a single background refresh replaces it.
+        A result older than ANALYSIS_MAX_AGE is recomputed inline, and
+        dropped if that fails too.
+
+        Returns:
+            The analysis, or None if there is no usable result.
+        """
+        cached = self._analysis
+        if cached is None:
+            with self._analysis_lock:
+                cached = self._analysis
+                if cached is None:
+                    self._refresh_analysis()
+                    cached = self._analysis
+                    if cached is None:
+                        return None
+            return cached[1]
+
+        built_at, analysis_data = cached
+        age = time.monotonic() - built_at
+        if age > ANALYSIS_MAX_AGE:
+            with self._analysis_lock:
+                if self._analysis is cached:
+                    # Background refreshes have kept failing
+                    analysis_data = self._analyze_usage()
+                    self._analysis = (
+                        None if analysis_data is None
+                        else (time.monotonic(), analysis_data)
+                    )
+                cached = self._analysis
+            return None if cached is None else cached[1]
+
+        if age > CACHE_TTL:
+            with self._refresh_lock:
+                if self._refresh_future is None or self._refresh_future.done():
+                    self._refresh_future = _refresh_executor.submit(
+                        self._refresh_analysis
+                    )
+        return analysis_data
+
     def get_plan_usage(self, plan: str = "max20") -> PlanUsageResponse:
         """Get real-time usage compared to plan limits.
 
@@ -566,22 +1230,7 @@ class DataService:
         )
 
         # Use analyze_usage to get proper session blocks (matches CLI)
-        # Cache this result as it's the most expensive operation
-        cache_key = f"analyze_{plan}_{self.session_window_hours}"
-        analysis_data = _data_cache.get(cache_key)
-
-        if analysis_data is None:
-            try:
-                analysis_data = analyze_usage(
-                    hours_back=self.session_window_hours * 2,  # Look back 2 windows
-                    quick_start=True,   # Like CLI - faster startup
-                    use_cache=True,     # Like CLI - use built-in cache
-                    data_path=self.settings.CLAUDE_DATA_PATH,
-                )
-                _data_cache.set(cache_key, analysis_data)
-            except Exception as e:
-                logger.error(f"Failed to analyze usage: {e}")
-                analysis_data = None
+        analysis_data = self._get_analysis()
 
         # Find active session block
         active_block = None
@@ -597,24 +1246,11 @@ class DataService:
             total_tokens = active_block.get("totalTokens", 0)
             total_messages = active_block.get("sentMessagesCount", 0)
 
-            # Parse session times
-            try:
-                start_time_str = active_block.get("startTime", "")
-                end_time_str = active_block.get("endTime", "")
-
-                if start_time_str:
-                    session_start = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-                else:
-                    session_start = now
-
-                if end_time_str:
-                    reset_time = datetime.fromisoformat(end_time_str.replace("Z", "+00:00"))
-                else:
-                    reset_time = session_start + timedelta(hours=self.session_window_hours)
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Failed to parse session times: {e}")
-                session_start = now
-                reset_time = now + timedelta(hours=self.session_window_hours)
+            # Session times were parsed when the analysis was cached
+            session_start = active_block.get("_startTime_dt") or now
+            reset_time = (
+                active_block.get("_endTime_dt") or session_start + self.session_window
+            )
         else:
             # Fallback: no active session
             total_cost = 0.0
@@ -622,34 +1258,28 @@ class DataService:
             total_messages = 0
             reset_time = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
 
-        # Calculate percentages (don't cap at 100% to show overage)
-        cost_pct = (total_cost / plan_config.cost_limit * 100) if plan_config.cost_limit > 0 else 0
-        token_pct = (total_tokens / plan_config.token_limit * 100) if plan_config.token_limit > 0 else 0
-        msg_pct = (total_messages / plan_config.message_limit * 100) if plan_config.message_limit > 0 else 0
-
-        # Format values
-        cost_usage = UsageVsLimit(
-            current=total_cost,
-            limit=plan_config.cost_limit,
-            percentage=round(cost_pct, 1),
-            formatted_current=f"${total_cost:.2f}",
-            formatted_limit=f"${plan_config.cost_limit:.2f}",
+        # Compare usage with the plan limits; the limit labels are
+        # constant per plan
+        cost_label, token_label, message_label = _format_plan_limits(
+            plan_config.cost_limit, plan_config.token_limit, plan_config.message_limit
         )
-
-        token_usage = UsageVsLimit(
-            current=float(total_tokens),
-            limit=float(plan_config.token_limit),
-            percentage=round(token_pct, 1),
-            formatted_current=f"{total_tokens:,}",
-            formatted_limit=f"{plan_config.token_limit:,}",
+        cost_usage = _usage_vs_limit(
+            float(total_cost),
+            float(plan_config.cost_limit),
+            f"${total_cost:.2f}",
+            cost_label,
         )
-
-        message_usage = UsageVsLimit(
-            current=float(total_messages),
-            limit=float(plan_config.message_limit),
-            percentage=round(msg_pct, 1),
-            formatted_current=str(total_messages),
-            formatted_limit=str(plan_config.message_limit),
+        token_usage = _usage_vs_limit(
+            float(total_tokens),
+            float(plan_config.token_limit),
+            f"{total_tokens:,}",
+            token_label,
+        )
+        message_usage = _usage_vs_limit(
+            float(total_messages),
+            float(plan_config.message_limit),
+            str(total_messages),
+            message_label,
         )
 
         # Calculate remaining time
@@ -665,9 +1295,11 @@ class DataService:
             remaining_formatted=remaining_formatted,
         )
 
+        # Load the session window once; it covers the burn-rate window too
+        entries = self._load_entries(hours_back=self.session_window_hours)
+
         # Calculate burn rate from recent entries
-        entries = self._load_entries(hours_back=1)
-        burn_rate = self._calculate_burn_rate(entries)
+        burn_rate = self._calculate_burn_rate(entries, now=now)
 
         # Model distribution from active block
         model_distribution: dict[str, float] = {}
@@ -675,7 +1307,6 @@ class DataService:
             model_distribution = active_block["modelDistribution"]
         elif active_block and analysis_data:
             # Calculate from entries if not in block
-            entries = self._load_entries(hours_back=self.session_window_hours)
             model_tokens: dict[str, int] = defaultdict(int)
             for entry in entries:
                 model = entry.model or "unknown"
@@ -690,14 +1321,14 @@ class DataService:
         # Predictions
         predictions: dict[str, str | None] = {
             "tokens_run_out": None,
-            "limit_resets_at": reset_time.strftime("%I:%M %p") if reset_time else None,
+            "limit_resets_at": _format_clock(reset_time) if reset_time else None,
         }
 
         if burn_rate.tokens_per_minute > 0 and total_tokens < plan_config.token_limit:
             remaining_tokens = plan_config.token_limit - total_tokens
             minutes_until_exhausted = remaining_tokens / burn_rate.tokens_per_minute
             exhaustion_time = now + timedelta(minutes=minutes_until_exhausted)
-            predictions["tokens_run_out"] = exhaustion_time.strftime("%I:%M %p")
+            predictions["tokens_run_out"] = _format_clock(exhaustion_time)
 
         return PlanUsageResponse(
             timestamp=now,
@@ -712,14 +1343,26 @@ class DataService:
         )
 
 
-@lru_cache
+# Shared DataService, created on first use
+_data_service: DataService | None = None
+
+
 def get_data_service() -> DataService:
-    """Get cached DataService instance.
+    """Get the shared DataService instance.
+
+    Called on every request through dependency injection, so this is a
+    plain global lookup rather than a locked cache. Two threads racing on
+    the first call may each build a service; one simply replaces the
+    other, which at worst costs one rebuilt realtime snapshot.
 
     Returns:
         DataService: Singleton data service instance.
     """
-    return DataService()
+    global _data_service
+    service = _data_service
+    if service is None:
+        service = _data_service = DataService()
+    return service
 
 
 def warm_cache(plan: str = "max20") -> None:
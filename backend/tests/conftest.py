@@ -1,40 +1,48 @@
 """Pytest configuration and fixtures for backend tests."""
 
+import copy
+from collections.abc import AsyncGenerator
+from unittest.mock import MagicMock
+
 import pytest
-from typing import AsyncGenerator
+import pytest_asyncio
 from fastapi import FastAPI
-from httpx import AsyncClient, ASGITransport
-from unittest.mock import MagicMock
+from httpx import ASGITransport, AsyncClient
 
-from app.main import app
 from app.services.data_service import DataService
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_app() -> FastAPI:
-    """Get the FastAPI app for testing."""
+    """Get the FastAPI app for testing.
+
+    Imported here rather than at module level so unit tests that never
+    request the app don't pay for building it.
+    """
+    from app.main import app
+
     return app
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_client(test_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async HTTP client for API testing."""
+    """Create one async HTTP client shared by all API tests.
+
+    Tests run on the session event loop (see asyncio_default_test_loop_scope)
+    so they can use a client bound to it.
+    """
+    # Requests are served in-process: ASGITransport enforces no timeouts and,
+    # since a transport is given, httpx never builds a connection pool.
+    # It also sends no lifespan events, so startup (cache warming, the
+    # broadcast task) never runs under the tests.
     transport = ASGITransport(app=test_app)
-    async with AsyncClient(
-        transport=transport,
-        base_url="http://test",
-        timeout=10.0,  # Prevent hanging tests
-    ) as client:
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
 
-@pytest.fixture
-def mock_data_service() -> MagicMock:
-    """Create a mock DataService for unit testing."""
-    service = MagicMock(spec=DataService)
-
-    # Mock common methods with realistic return values
-    service.get_realtime_usage.return_value = {
+# Return values configured on the mock DataService, keyed by method name
+MOCK_DATA_SERVICE_RETURNS: dict[str, object] = {
+    "get_realtime_usage": {
         "timestamp": "2024-12-03T10:00:00Z",
         "totalTokens": 1500000,
         "inputTokens": 500000,
@@ -49,9 +57,8 @@ def mock_data_service() -> MagicMock:
             "startTime": "2024-12-03T06:00:00Z",
             "endTime": "2024-12-03T11:00:00Z",
         },
-    }
-
-    service.get_plan_usage.return_value = {
+    },
+    "get_plan_usage": {
         "plan": "max20",
         "totalTokens": 1500000,
         "tokenLimit": 100000000,
@@ -65,9 +72,8 @@ def mock_data_service() -> MagicMock:
             "startTime": "2024-12-03T06:00:00Z",
             "endTime": "2024-12-03T11:00:00Z",
         },
-    }
-
-    service.get_daily_stats.return_value = {
+    },
+    "get_daily_stats": {
         "date": "2024-12-03",
         "totalTokens": 500000,
         "inputTokens": 150000,
@@ -76,9 +82,8 @@ def mock_data_service() -> MagicMock:
         "cacheReadTokens": 50000,
         "costUSD": 5.20,
         "requestCount": 50,
-    }
-
-    service.get_usage_history.return_value = [
+    },
+    "get_history": [
         {
             "date": "2024-12-01",
             "totalTokens": 450000,
@@ -97,12 +102,34 @@ def mock_data_service() -> MagicMock:
             "costUSD": 5.50,
             "requestCount": 55,
         },
-    ]
-
-    service.get_model_stats.return_value = [
+    ],
+    "get_model_stats": [
         {"model": "claude-sonnet-4-20250514", "count": 100, "tokens": 800000, "cost": 8.00},
         {"model": "claude-3-5-haiku-20241022", "count": 50, "tokens": 200000, "cost": 2.00},
-    ]
+    ],
+}
+
+
+@pytest.fixture(scope="session")
+def _mock_data_service_template() -> MagicMock:
+    """Build the spec'd DataService mock once for the whole session."""
+    return MagicMock(spec_set=DataService)
+
+
+@pytest.fixture
+def mock_data_service(_mock_data_service_template: MagicMock) -> MagicMock:
+    """Create a mock DataService for unit testing.
+
+    Reuses the session's spec'd mock, so the spec is only built once.
+    Copies of a MagicMock share their child mocks, so instead the mock is
+    reset and given fresh copies of the return values for each test.
+    """
+    service = _mock_data_service_template
+    service.reset_mock(return_value=True, side_effect=True)
+
+    # Mock common methods with realistic return values
+    for name, value in MOCK_DATA_SERVICE_RETURNS.items():
+        getattr(service, name).return_value = copy.deepcopy(value)
 
     return service
 
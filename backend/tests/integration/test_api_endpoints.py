@@ -1,5 +1,7 @@
 """Integration tests for API endpoints."""
 
+import asyncio
+
 import pytest
 from httpx import AsyncClient
 
@@ -8,63 +10,81 @@ class TestHealthEndpoint:
     """Tests for the /health endpoint."""
 
     @pytest.mark.asyncio
-    async def test_health_returns_ok(self, async_client: AsyncClient):
-        """Test that health endpoint returns 200 with expected structure."""
-        response = await async_client.get("/health")
+    async def test_health_degraded_while_cache_warming(self, test_app, async_client: AsyncClient):
+        """Test that health reports degraded until cache warm-up finishes."""
+        test_app.state.cache_warm = False
+        try:
+            response = await async_client.get("/health")
+        finally:
+            del test_app.state.cache_warm
 
-        assert response.status_code == 200
-        data = response.json()
+        assert response.json()["status"] == "degraded"
 
-        assert "status" in data
-        assert "version" in data
-        # Status can be "healthy" or "degraded" depending on data path availability
-        assert data["status"] in ["healthy", "degraded"]
+    @pytest.mark.asyncio
+    async def test_health_timestamp_reused_within_second(
+        self, async_client: AsyncClient, monkeypatch
+    ):
+        """Test that health timestamps are reused within the same second."""
+        monkeypatch.setattr("app.main.time.time", lambda: 1_700_000_000.5)
+
+        first = (await async_client.get("/health")).json()["timestamp"]
+        second = (await async_client.get("/health")).json()["timestamp"]
+
+        assert first == second
 
     @pytest.mark.asyncio
-    async def test_health_includes_data_path_status(self, async_client: AsyncClient):
-        """Test that health endpoint includes data path validation."""
+    async def test_health_includes_details(self, async_client: AsyncClient):
+        """Test that health endpoint includes configuration details."""
         response = await async_client.get("/health")
-        data = response.json()
+        details = response.json()["details"]
 
-        assert "data_path_valid" in data
-        # data_path_valid can be True or False depending on environment
+        assert "data_path" in details
+        assert "session_window_hours" in details
+        assert "websocket_interval" in details
 
 
-class TestUsageEndpoints:
-    """Tests for /api/usage/* endpoints."""
+class TestRootEndpoint:
+    """Tests for the / endpoint."""
 
     @pytest.mark.asyncio
-    async def test_realtime_returns_usage_data(self, async_client: AsyncClient):
-        """Test that realtime endpoint returns expected structure."""
-        response = await async_client.get("/api/usage/realtime")
+    async def test_root_returns_api_info(self, async_client: AsyncClient):
+        """Test that root endpoint returns API info and doc links."""
+        response = await async_client.get("/")
 
         assert response.status_code == 200
         data = response.json()
+        assert data["documentation"] == "/docs"
+        assert data["openapi"] == "/openapi.json"
+        assert "version" in data
 
-        # Check required fields - API uses nested structure
-        assert "timestamp" in data
-        # Tokens are in today_stats.tokens or session
-        has_session = "session" in data
-        has_today_stats = "today_stats" in data
-        assert has_session or has_today_stats
+
+class TestOpenAPI:
+    """Tests for the OpenAPI schema endpoint."""
 
     @pytest.mark.asyncio
-    async def test_plan_usage_default_plan(self, async_client: AsyncClient):
-        """Test plan-usage endpoint with default plan."""
-        response = await async_client.get("/api/usage/plan-usage")
+    async def test_openapi_schema_is_served(self, async_client: AsyncClient):
+        """Test that the OpenAPI schema is served and includes API routes."""
+        response = await async_client.get("/openapi.json")
 
         assert response.status_code == 200
-        data = response.json()
+        assert response.headers["content-type"] == "application/json"
+        schema = response.json()
+        assert "/api/usage/realtime" in schema["paths"]
+        assert "/openapi.json" not in schema["paths"]
 
-        # Check required fields - API returns nested structure
-        assert "plan" in data
-        # Token/cost usage might be in various structures
-        has_usage_data = (
-            "token_usage" in data
-            or "cost_usage" in data
-            or "session" in data
-        )
-        assert has_usage_data
+    @pytest.mark.asyncio
+    async def test_openapi_documents_response_models(self, async_client: AsyncClient):
+        """Test that response schemas are still documented for each route."""
+        response = await async_client.get("/openapi.json")
+        paths = response.json()["paths"]
+
+        ok = paths["/api/usage/realtime"]["get"]["responses"]["200"]
+        ref = ok["content"]["application/json"]["schema"]["$ref"]
+        assert ref.endswith("/RealtimeUsageResponse")
+
+
+class TestUsageEndpoints:
+    """Tests for /api/usage/* endpoints."""
 
     @pytest.mark.asyncio
     async def test_plan_usage_with_plan_param(self, async_client: AsyncClient):
@@ -90,17 +110,6 @@ class TestUsageEndpoints:
         # Should either return error or default to a valid plan
         assert response.status_code in [200, 400, 422]
 
-    @pytest.mark.asyncio
-    async def test_daily_stats_returns_data(self, async_client: AsyncClient):
-        """Test daily stats endpoint returns expected structure."""
-        response = await async_client.get("/api/usage/daily")
-
-        assert response.status_code == 200
-        data = response.json()
-
-        # Should have date field
-        assert "date" in data
-
     @pytest.mark.asyncio
     async def test_daily_stats_with_date_param(self, async_client: AsyncClient):
         """Test daily stats with specific date."""
@@ -110,54 +119,92 @@ class TestUsageEndpoints:
         data = response.json()
 
         assert "date" in data
+        assert data["date"] == "2024-12-01"
 
     @pytest.mark.asyncio
-    async def test_history_returns_list(self, async_client: AsyncClient):
-        """Test history endpoint returns a list or dict with history."""
-        response = await async_client.get("/api/usage/history")
+    async def test_daily_stats_invalid_date(self, async_client: AsyncClient):
+        """Test daily stats rejects malformed dates."""
+        response = await async_client.get("/api/usage/daily?date=not-a-date")
+
+        assert response.status_code == 400
 
-        assert response.status_code == 200
-        data = response.json()
 
-        # API might return list directly or wrapped in dict
-        assert isinstance(data, (list, dict))
+class TestReadOnlyEndpoints:
+    """Tests for the default GET endpoints, requested concurrently."""
 
     @pytest.mark.asyncio
-    async def test_history_with_days_param(self, async_client: AsyncClient):
-        """Test history endpoint with days parameter."""
-        response = await async_client.get("/api/usage/history?days=7")
+    async def test_default_endpoints_return_data(self, async_client: AsyncClient):
+        """Test that the default endpoints return their expected structures."""
+        urls = [
+            "/health",
+            "/api/usage/realtime",
+            "/api/usage/daily",
+            "/api/usage/history",
+            "/api/stats/models",
+        ]
+        responses = await asyncio.gather(*[async_client.get(url) for url in urls])
 
-        assert response.status_code == 200
-        data = response.json()
+        for url, response in zip(urls, responses, strict=True):
+            assert response.status_code == 200, url
+        health, realtime, daily, history, models = (r.json() for r in responses)
+
+        # Status can be "healthy" or "degraded" depending on data path availability
+        assert "version" in health
+        assert health["status"] in ["healthy", "degraded"]
+        assert "data_path_valid" in health
+
+        # Realtime uses a nested structure with session and today_stats
+        assert "timestamp" in realtime
+        assert "session" in realtime or "today_stats" in realtime
+
+        assert "date" in daily
 
-        # API might return list directly or wrapped in dict
-        assert isinstance(data, (list, dict))
+        # History and model stats might be a list or wrapped in a dict
+        assert isinstance(history, (list, dict))
+        assert isinstance(models, (list, dict))
 
 
-class TestStatsEndpoints:
-    """Tests for /api/stats/* endpoints."""
+class TestEndpointKeys:
+    """Tests that GET endpoints return their top-level response keys."""
 
     @pytest.mark.asyncio
-    async def test_model_stats_returns_data(self, async_client: AsyncClient):
-        """Test model stats endpoint returns expected structure."""
-        response = await async_client.get("/api/stats/models")
+    @pytest.mark.parametrize(
+        "url,keys",
+        [
+            ("/api/usage/plan-usage", ("plan", "token_usage", "cost_usage")),
+            ("/api/usage/history?days=7", ("days_requested", "daily_stats")),
+            ("/api/stats/models?days=7", ("models", "total_models")),
+        ],
+    )
+    async def test_returns_keys(self, async_client: AsyncClient, url, keys):
+        """Test that the endpoint responds with 200 and the expected keys."""
+        response = await async_client.get(url)
 
         assert response.status_code == 200
         data = response.json()
+        for key in keys:
+            assert key in data, key
 
-        # API might return list or dict with models
-        assert isinstance(data, (list, dict))
+
+class TestServiceErrors:
+    """Tests for error handling when the data service fails."""
 
     @pytest.mark.asyncio
-    async def test_model_stats_with_days_param(self, async_client: AsyncClient):
-        """Test model stats with days parameter."""
-        response = await async_client.get("/api/stats/models?days=7")
+    async def test_service_error_returns_generic_500(
+        self, test_app, async_client: AsyncClient, mock_data_service
+    ):
+        """Test that service failures map to a 500 without leaking details."""
+        from app.services.data_service import get_data_service
 
-        assert response.status_code == 200
-        data = response.json()
+        mock_data_service.get_realtime_usage.side_effect = RuntimeError("secret path /x")
+        test_app.dependency_overrides[get_data_service] = lambda: mock_data_service
+        try:
+            response = await async_client.get("/api/usage/realtime")
+        finally:
+            test_app.dependency_overrides.clear()
 
-        # API might return list or dict with models
-        assert isinstance(data, (list, dict))
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to retrieve realtime usage"
 
 
 class TestCORSHeaders:
@@ -176,3 +223,16 @@ class TestCORSHeaders:
 
         # CORS preflight should succeed or endpoint should allow the origin
         assert response.status_code in [200, 204, 405]
+
+    @pytest.mark.asyncio
+    async def test_cors_rejects_unknown_origin(self, async_client: AsyncClient):
+        """Test that CORS preflight from an unknown origin is not allowed."""
+        response = await async_client.options(
+            "/api/usage/realtime",
+            headers={
+                "Origin": "http://evil.example",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        assert "access-control-allow-origin" not in response.headers
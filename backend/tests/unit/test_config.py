@@ -0,0 +1,82 @@
+"""Unit tests for application settings."""
+
+from pathlib import Path
+
+from app.core.config import Settings
+
+
+class TestSettingsDataPath:
+    """Tests for data path resolution and validation."""
+
+    def test_get_data_path_is_computed_once(self, tmp_path: Path):
+        """Test that the resolved data path is reused across calls."""
+        settings = Settings(CLAUDE_DATA_PATH=str(tmp_path))
+
+        first = settings.get_data_path()
+        second = settings.get_data_path()
+
+        assert first == tmp_path
+        assert first is second
+
+    def test_get_data_path_expands_user(self, monkeypatch, tmp_path: Path):
+        """Test that ~ is expanded in the configured data path."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        settings = Settings(CLAUDE_DATA_PATH="~/projects")
+
+        assert settings.get_data_path() == tmp_path / "projects"
+
+    def test_is_data_path_valid_caches_result(self, tmp_path: Path):
+        """Test that the validity check is cached within the TTL."""
+        data_dir = tmp_path / "projects"
+        data_dir.mkdir()
+        settings = Settings(CLAUDE_DATA_PATH=str(data_dir))
+
+        assert settings.is_data_path_valid() is True
+
+        # Removing the directory is not observed until the TTL expires
+        data_dir.rmdir()
+        assert settings.is_data_path_valid() is True
+
+    def test_is_data_path_valid_rechecks_after_ttl(self, tmp_path: Path, monkeypatch):
+        """Test that the validity check is refreshed after the TTL."""
+        data_dir = tmp_path / "projects"
+        data_dir.mkdir()
+        settings = Settings(CLAUDE_DATA_PATH=str(data_dir))
+        assert settings.is_data_path_valid() is True
+
+        data_dir.rmdir()
+        expired = settings._data_path_valid[0] + 1
+        monkeypatch.setattr("app.core.config.time.monotonic", lambda: expired)
+
+        assert settings.is_data_path_valid() is False
+
+    def test_missing_data_path_is_invalid(self, tmp_path: Path):
+        """Test that a non-existent data path is reported as invalid."""
+        settings = Settings(CLAUDE_DATA_PATH=str(tmp_path / "missing"))
+
+        assert settings.is_data_path_valid() is False
+
+
+class TestSettingsCors:
+    """Tests for CORS configuration."""
+
+    def test_cors_settings_are_tuples(self):
+        """Test that CORS settings default to immutable tuples."""
+        settings = Settings()
+
+        assert isinstance(settings.CORS_ORIGINS, tuple)
+        assert isinstance(settings.CORS_ALLOW_METHODS, tuple)
+        assert isinstance(settings.CORS_ALLOW_HEADERS, tuple)
+
+    def test_cors_origins_from_env(self, monkeypatch):
+        """Test that CORS origins parse from a JSON list in the environment."""
+        monkeypatch.setenv("CORS_ORIGINS", '["https://example.com"]')
+        settings = Settings()
+
+        assert settings.CORS_ORIGINS == ("https://example.com",)
+
+    def test_cors_origins_set(self):
+        """Test that the origin set mirrors CORS_ORIGINS."""
+        settings = Settings(CORS_ORIGINS=("http://a.test", "http://b.test"))
+
+        assert settings.cors_origins_set == frozenset({"http://a.test", "http://b.test"})
@@ -1,12 +1,163 @@
 """Unit tests for DataService class."""
 
-import pytest
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from datetime import timezone as tz
+from operator import attrgetter
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
-from typing import List
 
-from app.services.data_service import DataService, DataCache, CacheEntry
+import pytest
+from claude_monitor.core.models import UsageEntry
+from claude_monitor.core.plans import PlanConfig
+
+from app.models.schemas import UsageEntryResponse, UsageVsLimit
+from app.services.data_service import (
+    ANALYSIS_MAX_AGE,
+    CACHE_TTL,
+    FINGERPRINT_TTL,
+    CacheEntry,
+    DataCache,
+    DataService,
+    _count_by_hour,
+    _format_clock,
+    _format_plan_limits,
+    _parse_iso_datetime,
+    _split_by_day,
+    _to_records,
+    _usage_vs_limit,
+    get_data_service,
+)
+
+# Fixed "current" time for the service and the entries built in these tests
+NOW = datetime(2024, 12, 3, 10, 0, tzinfo=tz.utc)
+
+# Fields shared by the single-entry fixtures in these tests
+BASE_FIELDS = {
+    "input_tokens": 1000,
+    "output_tokens": 2000,
+    "cache_creation_tokens": 100,
+    "cache_read_tokens": 50,
+    "cost_usd": 0.05,
+    "model": "claude-sonnet-4",
+    "message_id": "msg-123",
+    "request_id": "req-456",
+}
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return NOW.astimezone(tz) if tz is not None else NOW.replace(tzinfo=None)
+
+
+class FrozenDate(date):
+    """date whose today() is the date of NOW."""
+
+    @classmethod
+    def today(cls):
+        return NOW.date()
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    """Pin the service's clock to NOW so results don't depend on when tests run."""
+    monkeypatch.setattr("app.services.data_service.datetime", FrozenDatetime)
+    monkeypatch.setattr("app.services.data_service.date", FrozenDate)
+
+
+# Plan returned by the patched Plans lookup; frozen, so tests can share it
+MAX20_PLAN = PlanConfig(
+    name="max20",
+    token_limit=100000000,
+    cost_limit=600,
+    message_limit=1000,
+    display_name="Max (20x)",
+)
+
+
+def fake_entry(timestamp: datetime, **fields) -> SimpleNamespace:
+    """Create a lightweight UsageEntry stand-in with zeroed defaults.
+
+    Unlike a MagicMock, reading a field that was never set raises
+    AttributeError instead of returning a child mock.
+    """
+    return SimpleNamespace(
+        **{
+            "timestamp": timestamp,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_creation_tokens": 0,
+            "cache_read_tokens": 0,
+            "cost_usd": 0.0,
+            "model": "",
+            "message_id": "",
+            "request_id": "",
+            **fields,
+        }
+    )
+
+
+@pytest.fixture(scope="class")
+def mock_settings():
+    """Create mock settings, shared by the tests of a class.
+
+    Tests must not mutate the settings; the module cache is cleared
+    between tests where it matters.
+    """
+    settings = MagicMock()
+    settings.CLAUDE_DATA_PATH = "/fake/path"
+    settings.SESSION_WINDOW_HOURS = 5
+    settings.REALTIME_CACHE_TTL = 1.0
+    return settings
+
+
+@pytest.fixture(scope="class")
+def data_service(mock_settings):
+    """Create one DataService per class for tests that only call pure methods."""
+    return DataService(settings=mock_settings)
+
+
+# Totals over mock_usage_entries, whose i-th entry scales each field by i + 1
+EXPECTED_TOKEN_TOTALS = {
+    "input_tokens": 15000,
+    "output_tokens": 30000,
+    "cache_creation_tokens": 1500,
+    "cache_read_tokens": 750,
+}
+EXPECTED_COST = 0.75
+
+
+@pytest.fixture(scope="module")
+def mock_usage_entries():
+    """Create usage entries sorted by timestamp, shared by the module.
+
+    The entries are read-only inputs, so one tuple is built per module.
+    """
+    # Create UsageEntry-like objects, oldest first like the reader
+    return tuple(
+        fake_entry(
+            NOW - timedelta(hours=i),
+            input_tokens=1000 * (i + 1),
+            output_tokens=2000 * (i + 1),
+            cache_creation_tokens=100 * (i + 1),
+            cache_read_tokens=50 * (i + 1),
+            cost_usd=0.05 * (i + 1),
+            model=f"claude-model-{i % 2}",
+            message_id=f"msg-{i}",
+            request_id=f"req-{i}",
+        )
+        for i in reversed(range(5))
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock used for cache expiry with a settable one."""
+    now = [1000.0]
+    monkeypatch.setattr("app.services.data_service.time.monotonic", lambda: now[0])
+    return now
 
 
 class TestCacheEntry:
@@ -17,12 +168,10 @@ class TestCacheEntry:
         entry = CacheEntry(data="test", ttl=60)
         assert not entry.is_expired()
 
-    def test_cache_entry_expired(self):
+    def test_cache_entry_expired(self, clock):
         """Test that cache entry expires after TTL."""
         entry = CacheEntry(data="test", ttl=0)
-        # Sleep briefly to ensure TTL passes
-        import time
-        time.sleep(0.01)
+        clock[0] += 0.01
         assert entry.is_expired()
 
     def test_cache_entry_stores_data(self):
@@ -47,14 +196,31 @@ class TestDataCache:
         result = cache.get("test_key")
         assert result == {"value": 123}
 
-    def test_expired_entry_returns_none(self):
+    def test_expired_entry_returns_none(self, clock):
         """Test that expired entries return None."""
         cache = DataCache()
         cache.set("test_key", "value", ttl=0)
-        import time
-        time.sleep(0.01)
+        clock[0] += 0.01
         assert cache.get("test_key") is None
 
+    def test_set_drops_expired_entries(self, clock):
+        """Test that writes prune entries that have expired."""
+        cache = DataCache()
+        cache.set("stale", "value", ttl=0)
+        clock[0] += 0.01
+        cache.set("fresh", "value")
+        assert "stale" not in cache._cache
+        assert cache.get("fresh") == "value"
+
+    def test_set_publishes_a_new_dict(self):
+        """Test that writes never mutate a dict readers may hold."""
+        cache = DataCache()
+        cache.set("key1", "value1")
+        snapshot = cache._cache
+        cache.set("key2", "value2")
+        assert "key2" not in snapshot
+        assert cache.get("key2") == "value2"
+
     def test_clear_removes_all_entries(self):
         """Test that clear removes all entries."""
         cache = DataCache()
@@ -65,58 +231,70 @@ class TestDataCache:
         assert cache.get("key2") is None
 
 
-class TestDataService:
-    """Tests for DataService class."""
+class TestEntryRuns:
+    """Tests for splitting sorted entries into hour and day runs."""
 
     @pytest.fixture
-    def mock_settings(self):
-        """Create mock settings."""
-        settings = MagicMock()
-        settings.CLAUDE_DATA_PATH = "~/.claude/projects"
-        settings.SESSION_WINDOW_HOURS = 5
-        return settings
+    def entries(self):
+        """Create entries spanning two days, oldest first."""
+        start = datetime(2024, 12, 2, 22, 15, tzinfo=tz.utc)
+        offsets = [0, 10, 50, 70, 125, 130, 1500]
+        return [fake_entry(start + timedelta(minutes=minutes)) for minutes in offsets]
 
-    @pytest.fixture
-    def data_service(self, mock_settings):
-        """Create DataService with mock settings."""
-        return DataService(settings=mock_settings)
+    def test_count_by_hour(self, entries):
+        """Test that entries are counted under their hour of the day."""
+        hourly = _count_by_hour(entries)
 
-    @pytest.fixture
-    def mock_usage_entries(self):
-        """Create mock usage entries."""
-        now = datetime.now(tz.utc)
-        # Create mock UsageEntry-like objects
-        entries = []
-        for i in range(5):
-            entry = MagicMock()
-            entry.timestamp = now - timedelta(hours=i)
-            entry.input_tokens = 1000 * (i + 1)
-            entry.output_tokens = 2000 * (i + 1)
-            entry.cache_creation_tokens = 100 * (i + 1)
-            entry.cache_read_tokens = 50 * (i + 1)
-            entry.cost_usd = 0.05 * (i + 1)
-            entry.model = f"claude-model-{i % 2}"
-            entry.message_id = f"msg-{i}"
-            entry.request_id = f"req-{i}"
-            entries.append(entry)
-        return entries
+        assert hourly[22] == 2
+        assert hourly[23] == 3
+        assert hourly[0] == 2
+        assert sum(hourly) == len(entries)
+        assert hourly == [
+            sum(1 for e in entries if e.timestamp.hour == hour) for hour in range(24)
+        ]
+
+    def test_count_by_hour_empty(self):
+        """Test that no entries give an all-zero distribution."""
+        assert _count_by_hour([]) == [0] * 24
+
+    def test_count_by_hour_accumulates_in_place(self, entries):
+        """Test that counts are added into a given hourly list."""
+        hourly = [1] * 24
+
+        result = _count_by_hour(entries, hourly)
+
+        assert result is hourly
+        assert hourly[22] == 3
+        assert sum(hourly) == 24 + len(entries)
+
+    def test_split_by_day(self, entries):
+        """Test that entries are split into per-day runs in date order."""
+        runs = _split_by_day(entries)
+
+        assert [(day.isoformat(), len(run)) for day, run in runs] == [
+            ("2024-12-02", 4),
+            ("2024-12-03", 3),
+        ]
+        assert [e for _, run in runs for e in run] == entries
+
+
+class TestDataService:
+    """Tests for DataService class."""
 
     def test_calculate_token_breakdown(self, data_service, mock_usage_entries):
         """Test token breakdown calculation."""
         breakdown = data_service._calculate_token_breakdown(mock_usage_entries)
 
-        # Calculate expected totals
-        expected_input = sum(e.input_tokens for e in mock_usage_entries)
-        expected_output = sum(e.output_tokens for e in mock_usage_entries)
-        expected_cache_creation = sum(e.cache_creation_tokens for e in mock_usage_entries)
-        expected_cache_read = sum(e.cache_read_tokens for e in mock_usage_entries)
-        expected_total = expected_input + expected_output + expected_cache_creation + expected_cache_read
+        for field, expected in EXPECTED_TOKEN_TOTALS.items():
+            assert getattr(breakdown, field) == expected, field
+        assert breakdown.total_tokens == sum(EXPECTED_TOKEN_TOTALS.values())
 
-        assert breakdown.input_tokens == expected_input
-        assert breakdown.output_tokens == expected_output
-        assert breakdown.cache_creation_tokens == expected_cache_creation
-        assert breakdown.cache_read_tokens == expected_cache_read
-        assert breakdown.total_tokens == expected_total
+    def test_calculate_totals_includes_cost(self, data_service, mock_usage_entries):
+        """Test that totals aggregate tokens and cost in one call."""
+        tokens, cost = data_service._calculate_totals(mock_usage_entries)
+
+        assert tokens == data_service._calculate_token_breakdown(mock_usage_entries)
+        assert cost == pytest.approx(EXPECTED_COST)
 
     def test_calculate_token_breakdown_empty_list(self, data_service):
         """Test token breakdown with empty list."""
@@ -127,6 +305,8 @@ class TestDataService:
         assert breakdown.cache_creation_tokens == 0
         assert breakdown.cache_read_tokens == 0
         assert breakdown.total_tokens == 0
+        # The empty result is a shared instance rather than rebuilt per call
+        assert data_service._calculate_token_breakdown([]) is breakdown
 
     def test_calculate_session_info_no_entries(self, data_service):
         """Test session info with no entries."""
@@ -151,6 +331,74 @@ class TestDataService:
         assert session_info.tokens_in_window > 0
         assert session_info.cost_in_window > 0
 
+    def test_window_start_index(self, data_service, mock_usage_entries):
+        """Test that the window start is found by timestamp."""
+        window_start = mock_usage_entries[2].timestamp
+
+        assert data_service._window_start_index(mock_usage_entries, window_start) == 2
+        assert data_service._window_start_index(
+            mock_usage_entries, window_start + timedelta(seconds=1)
+        ) == 3
+
+    def test_window_totals(self, data_service, mock_usage_entries):
+        """Test that window totals cover only entries inside the window."""
+        window_start = mock_usage_entries[3].timestamp
+        tokens, cost, first = data_service._window_totals(mock_usage_entries, window_start)
+
+        inside = mock_usage_entries[3:]
+        assert tokens == data_service._calculate_token_breakdown(inside).total_tokens
+        assert cost == pytest.approx(sum(e.cost_usd for e in inside))
+        assert first == window_start
+
+    def test_nested_window_totals_match_separate_windows(
+        self, data_service, mock_usage_entries
+    ):
+        """Test that nested window totals equal two separate window scans."""
+        now = mock_usage_entries[-1].timestamp
+        outer_start = now - timedelta(hours=3, minutes=30)
+        inner_start = now - timedelta(hours=1, minutes=30)
+
+        outer, inner = data_service._nested_window_totals(
+            mock_usage_entries, outer_start, inner_start
+        )
+
+        for totals, window_start in ((outer, outer_start), (inner, inner_start)):
+            tokens, cost, first = data_service._window_totals(mock_usage_entries, window_start)
+            assert totals[0] == tokens
+            assert totals[1] == pytest.approx(cost)
+            assert totals[2] == first
+
+    def test_nested_window_totals_empty(self, data_service):
+        """Test that empty windows report no first timestamp."""
+        outer, inner = data_service._nested_window_totals([], NOW, NOW)
+
+        assert outer == (0, 0.0, None)
+        assert inner == (0, 0.0, None)
+
+    def test_window_totals_empty_window(self, data_service, mock_usage_entries):
+        """Test that an empty window reports no first timestamp."""
+        window_start = mock_usage_entries[-1].timestamp + timedelta(seconds=1)
+
+        assert data_service._window_totals(mock_usage_entries, window_start) == (0, 0.0, None)
+
+    def test_calculate_session_info_excludes_old_entries(self, data_service, mock_usage_entries):
+        """Test that only entries inside the session window are counted."""
+        old_entry = fake_entry(NOW - timedelta(hours=10), input_tokens=10**6)
+
+        with_old = data_service._calculate_session_info([old_entry, *mock_usage_entries])
+        without_old = data_service._calculate_session_info(mock_usage_entries)
+
+        assert with_old.tokens_in_window == without_old.tokens_in_window
+        assert with_old.session_start == mock_usage_entries[0].timestamp
+
+    def test_calculate_session_info_uses_given_now(self, data_service, mock_usage_entries):
+        """Test that remaining time is measured from the given instant."""
+        now = mock_usage_entries[0].timestamp + timedelta(hours=1)
+        session_info = data_service._calculate_session_info(mock_usage_entries, now=now)
+
+        assert session_info.session_end == mock_usage_entries[0].timestamp + timedelta(hours=5)
+        assert session_info.remaining_minutes == 240.0
+
     def test_calculate_burn_rate_no_entries(self, data_service):
         """Test burn rate with no entries."""
         burn_rate = data_service._calculate_burn_rate([])
@@ -168,21 +416,11 @@ class TestDataService:
 
     def test_entry_to_response(self, data_service):
         """Test UsageEntry to UsageEntryResponse conversion."""
-        now = datetime.now(tz.utc)
-        entry = MagicMock()
-        entry.timestamp = now
-        entry.input_tokens = 1000
-        entry.output_tokens = 2000
-        entry.cache_creation_tokens = 100
-        entry.cache_read_tokens = 50
-        entry.cost_usd = 0.05
-        entry.model = "claude-sonnet-4"
-        entry.message_id = "msg-123"
-        entry.request_id = "req-456"
+        entry = fake_entry(NOW, **BASE_FIELDS)
 
         response = data_service._entry_to_response(entry)
 
-        assert response.timestamp == now
+        assert response.timestamp == NOW
         assert response.input_tokens == 1000
         assert response.output_tokens == 2000
         assert response.cache_creation_tokens == 100
@@ -191,26 +429,97 @@ class TestDataService:
         assert response.model == "claude-sonnet-4"
         assert response.message_id == "msg-123"
         assert response.request_id == "req-456"
+        assert response.total_tokens == 3150
+        assert response.model_dump()["total_tokens"] == 3150
 
 
 class TestDataServiceWithMocks:
     """Tests for DataService methods using mocked data loading."""
 
     @pytest.fixture(autouse=True)
-    def clear_cache(self):
-        """Clear cache before each test."""
-        from app.services.data_service import _data_cache
-        _data_cache.clear()
-        yield
-        _data_cache.clear()
+    def isolated_cache(self, monkeypatch):
+        """Give each test its own empty module cache."""
+        monkeypatch.setattr("app.services.data_service._data_cache", DataCache())
 
     @pytest.fixture
-    def mock_settings(self):
-        """Create mock settings."""
-        settings = MagicMock()
-        settings.CLAUDE_DATA_PATH = "/fake/path"
-        settings.SESSION_WINDOW_HOURS = 5
-        return settings
+    def plan_usage_mocks(self):
+        """Patch data loading, analysis and plan lookup for plan usage tests.
+
+        Yields (load_usage_entries, analyze_usage) mocks; loading returns no
+        entries and Plans resolves to a max20 plan unless a test overrides it.
+        """
+        with patch("app.services.data_service.load_usage_entries") as mock_load, \
+             patch("app.services.data_service.analyze_usage") as mock_analyze, \
+             patch("app.services.data_service.Plans") as mock_plans:
+            mock_plans.get_plan_by_name.return_value = MAX20_PLAN
+            mock_load.return_value = ([], {})
+            yield mock_load, mock_analyze
+
+    def test_entry_to_response_matches_validated_model(self, mock_settings):
+        """Test that unvalidated conversion matches validated construction."""
+        entry = UsageEntry(timestamp=NOW, **BASE_FIELDS)
+        validated = UsageEntryResponse.model_validate(entry, from_attributes=True)
+
+        service = DataService(settings=mock_settings)
+        record = _to_records([entry])[0]
+        response = service._entry_to_response(record)
+
+        assert response == validated
+        assert response.model_dump() == validated.model_dump()
+        assert service._entries_to_response([record, record]) == [validated, validated]
+
+    def test_to_records_shares_model_names(self):
+        """Test that records keep entry fields and share repeated model names."""
+        entries = [
+            UsageEntry(
+                timestamp=datetime(2024, 12, 3, 10, i, tzinfo=tz.utc),
+                input_tokens=i,
+                output_tokens=2 * i,
+                # Separate but equal strings, as parsed from JSON lines
+                model="".join(["claude-", "sonnet-4"]),
+                message_id=f"msg-{i}",
+            )
+            for i in range(2)
+        ]
+
+        records = _to_records(entries)
+
+        assert [r.message_id for r in records] == ["msg-0", "msg-1"]
+        assert records[1].output_tokens == 2
+        assert records[0].model == "claude-sonnet-4"
+        assert records[0].model is records[1].model
+
+    def test_get_data_fingerprint_tracks_jsonl_files(self, mock_settings, tmp_path, clock):
+        """Test that the fingerprint changes when JSONL data is appended."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        log_file = project_dir / "session.jsonl"
+        log_file.write_text('{"a": 1}\n')
+        (project_dir / "notes.txt").write_text("ignored")
+
+        with patch.object(mock_settings, "get_data_path", return_value=tmp_path):
+            service = DataService(settings=mock_settings)
+        before = service.get_data_fingerprint()
+        with log_file.open("a") as f:
+            f.write('{"b": 2}\n')
+        clock[0] += FINGERPRINT_TTL + 1
+        after = service.get_data_fingerprint()
+
+        assert before[1] == len('{"a": 1}\n')
+        assert after != before
+
+    def test_get_data_fingerprint_reuses_recent_walk(self, mock_settings, clock):
+        """Test that the data tree is walked at most once per FINGERPRINT_TTL."""
+        service = DataService(settings=mock_settings)
+
+        with patch("app.services.data_service.os.walk", return_value=[]) as mock_walk:
+            service.get_data_fingerprint()
+            service.get_data_fingerprint()
+            assert mock_walk.call_count == 1
+
+            clock[0] += FINGERPRINT_TTL + 1
+            service.get_data_fingerprint()
+            assert mock_walk.call_count == 2
 
     def test_get_project_stats_placeholder(self, mock_settings):
         """Test get_project_stats returns empty placeholder."""
@@ -220,48 +529,47 @@ class TestDataServiceWithMocks:
         assert stats.total_projects == 0
         assert stats.projects == []
 
-    def test_get_today_stats_no_data(self, mock_settings):
-        """Test get_today_stats with no data."""
-        with patch("app.services.data_service.load_usage_entries") as mock_load:
-            mock_load.return_value = ([], {})
-            service = DataService(settings=mock_settings)
-            stats = service.get_today_stats()
-
-            assert stats.total_requests == 0
-            assert stats.tokens.total_tokens == 0
-
-    def test_get_history_no_data(self, mock_settings):
-        """Test get_history with no data."""
-        with patch("app.services.data_service.load_usage_entries") as mock_load:
-            mock_load.return_value = ([], {})
-            service = DataService(settings=mock_settings)
-            history = service.get_history(days=7)
-
-            assert history.days_requested == 7
-            assert history.days_with_data == 0
-
-    def test_get_model_stats_no_data(self, mock_settings):
-        """Test get_model_stats with no data."""
+    @pytest.mark.parametrize(
+        "method,kwargs,expected",
+        [
+            (
+                "get_today_stats",
+                {},
+                {
+                    "total_requests": 0,
+                    "tokens.total_tokens": 0,
+                    "hourly_distribution": [0] * 24,
+                },
+            ),
+            ("get_history", {"days": 7}, {"days_requested": 7, "days_with_data": 0}),
+            (
+                "get_model_stats",
+                {"days": 7},
+                {"total_models": 0, "models": [], "period_start": None, "period_end": None},
+            ),
+        ],
+    )
+    def test_stats_no_data(self, mock_settings, method, kwargs, expected):
+        """Test that stats methods report empty results with no data."""
         with patch("app.services.data_service.load_usage_entries") as mock_load:
             mock_load.return_value = ([], {})
             service = DataService(settings=mock_settings)
-            stats = service.get_model_stats(days=7)
+            stats = getattr(service, method)(**kwargs)
 
-            assert stats.total_models == 0
-            assert stats.models == []
-            assert stats.period_start is None
-            assert stats.period_end is None
+        for path, value in expected.items():
+            assert attrgetter(path)(stats) == value, path
 
     def test_load_entries_caches_result(self, mock_settings):
         """Test that _load_entries caches results."""
-        entry = MagicMock()
-        entry.timestamp = datetime.now(tz.utc)
-        entry.input_tokens = 100
-        entry.output_tokens = 200
-        entry.cache_creation_tokens = 10
-        entry.cache_read_tokens = 5
-        entry.cost_usd = 0.01
-        entry.model = "claude-test"
+        entry = fake_entry(
+            NOW,
+            input_tokens=100,
+            output_tokens=200,
+            cache_creation_tokens=10,
+            cache_read_tokens=5,
+            cost_usd=0.01,
+            model="claude-test",
+        )
 
         with patch("app.services.data_service.load_usage_entries") as mock_load:
             mock_load.return_value = ([entry], {})
@@ -276,6 +584,61 @@ class TestDataServiceWithMocks:
             assert mock_load.call_count == 1
             assert result1 == result2
 
+    def test_load_entries_slices_narrower_window(self, mock_settings):
+        """Test that a narrower window is sliced from a wider cached load."""
+        entries = [fake_entry(NOW - timedelta(hours=hours_ago)) for hours_ago in (30, 10, 1)]
+
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
+            mock_load.return_value = (entries, {})
+            service = DataService(settings=mock_settings)
+
+            def timestamps(hours_back):
+                return [e.timestamp for e in service._load_entries(hours_back=hours_back)]
+
+            assert timestamps(48) == [e.timestamp for e in entries]
+            assert timestamps(24) == [e.timestamp for e in entries[1:]]
+            assert timestamps(5) == [e.timestamp for e in entries[2:]]
+            assert mock_load.call_count == 1
+
+            # A wider window than the cached one needs a fresh load
+            service._load_entries(hours_back=72)
+            assert mock_load.call_count == 2
+
+    def test_load_entries_sorts_by_timestamp(self, mock_settings):
+        """Test that loaded entries are returned oldest first."""
+        entries = [fake_entry(NOW - timedelta(hours=hours_ago)) for hours_ago in (1, 10, 5)]
+
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
+            mock_load.return_value = (entries, {})
+            service = DataService(settings=mock_settings)
+            result = service._load_entries(hours_back=24)
+
+        timestamps = [e.timestamp for e in result]
+        assert timestamps == sorted(timestamps)
+
+    def test_load_entries_reloads_when_data_changes(self, mock_settings):
+        """Test that a changed data fingerprint invalidates cached entries."""
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
+            mock_load.return_value = ([], {})
+            service = DataService(settings=mock_settings)
+
+            with patch.object(service, "get_data_fingerprint", return_value=(1, 1)):
+                service._load_entries(hours_back=24)
+                service._load_entries(hours_back=24)
+            with patch.object(service, "get_data_fingerprint", return_value=(2, 2)):
+                service._load_entries(hours_back=24)
+
+            assert mock_load.call_count == 2
+
+    def test_get_today_stats_uses_given_entries(self, mock_settings):
+        """Test that get_today_stats skips loading when given entries."""
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
+            service = DataService(settings=mock_settings)
+            stats = service.get_today_stats(entries=[])
+
+            mock_load.assert_not_called()
+            assert stats.total_requests == 0
+
     def test_load_entries_handles_exception(self, mock_settings):
         """Test that _load_entries handles exceptions gracefully."""
         with patch("app.services.data_service.load_usage_entries") as mock_load:
@@ -287,44 +650,81 @@ class TestDataServiceWithMocks:
 
     def test_get_today_stats_with_entries(self, mock_settings):
         """Test get_today_stats with mock entries."""
-        from datetime import date as date_cls
-        now = datetime.now(tz.utc)
-        # Use local date (like the service does) instead of UTC date
-        local_today = date_cls.today()
-
-        entry = MagicMock()
-        entry.timestamp = now
-        entry.input_tokens = 1000
-        entry.output_tokens = 2000
-        entry.cache_creation_tokens = 100
-        entry.cache_read_tokens = 50
-        entry.cost_usd = 0.05
-        entry.model = "claude-sonnet-4"
+        entry = fake_entry(NOW, **BASE_FIELDS)
 
         with patch("app.services.data_service.load_usage_entries") as mock_load:
             mock_load.return_value = ([entry], {})
             service = DataService(settings=mock_settings)
             stats = service.get_today_stats()
 
-            # The service uses local date.today(), so we compare with that
-            assert stats.date == local_today.isoformat()
+            assert stats.date == NOW.date().isoformat()
             assert stats.tokens is not None
+            assert len(stats.hourly_distribution) == 24
+            assert sum(stats.hourly_distribution) == stats.total_requests
+
+    def test_get_today_stats_skips_earlier_days(self, mock_settings):
+        """Test that entries from before today are not counted."""
+        entries = [
+            fake_entry(timestamp, input_tokens=100, cost_usd=0.01, model="claude-sonnet-4")
+            for timestamp in (NOW - timedelta(days=2), NOW)
+        ]
+
+        service = DataService(settings=mock_settings)
+        stats = service.get_today_stats(entries=entries)
+
+        assert stats.total_requests == 1
+        assert stats.tokens.input_tokens == 100
+
+    def test_get_today_stats_models_used_unique(self, mock_settings):
+        """Test that models_used lists each model once and skips missing models."""
+        entries = [
+            fake_entry(NOW, input_tokens=100, cost_usd=0.01, model=model)
+            for model in ("claude-sonnet-4", None, "claude-sonnet-4", "")
+        ]
+
+        service = DataService(settings=mock_settings)
+        stats = service.get_today_stats(entries=entries)
+
+        assert stats.total_requests == 4
+        assert stats.models_used == ["claude-sonnet-4"]
+
+    def test_get_daily_stats_only_counts_target_date(self, mock_settings):
+        """Test that daily stats aggregate only the requested date."""
+        entries = [
+            fake_entry(
+                NOW - timedelta(days=days_ago),
+                input_tokens=100,
+                output_tokens=200,
+                cache_creation_tokens=10,
+                cache_read_tokens=5,
+                cost_usd=0.01,
+                model=model,
+            )
+            for days_ago, model in (
+                (1, "claude-3-5-haiku"),
+                (0, "claude-sonnet-4"),
+                (0, "claude-sonnet-4"),
+            )
+        ]
+
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
+            mock_load.return_value = (entries, {})
+            service = DataService(settings=mock_settings)
+            stats = service.get_daily_stats(NOW.date())
+
+        assert stats.date == NOW.date().isoformat()
+        assert stats.total_requests == 2
+        assert stats.tokens.total_tokens == 630
+        assert stats.total_cost_usd == pytest.approx(0.02)
+        assert stats.models_used == ["claude-sonnet-4"]
+        assert stats.hourly_distribution[NOW.hour] == 2
 
     def test_get_history_with_entries(self, mock_settings):
         """Test get_history with mock entries."""
-        now = datetime.now(tz.utc)
-
-        entries = []
-        for i in range(3):
-            entry = MagicMock()
-            entry.timestamp = now - timedelta(days=i)
-            entry.input_tokens = 1000
-            entry.output_tokens = 2000
-            entry.cache_creation_tokens = 100
-            entry.cache_read_tokens = 50
-            entry.cost_usd = 0.05
-            entry.model = "claude-sonnet-4"
-            entries.append(entry)
+        entries = [
+            fake_entry(NOW - timedelta(days=i), **BASE_FIELDS)
+            for i in reversed(range(3))  # oldest first, like the reader
+        ]
 
         with patch("app.services.data_service.load_usage_entries") as mock_load:
             mock_load.return_value = (entries, {})
@@ -333,28 +733,29 @@ class TestDataServiceWithMocks:
 
             assert history.days_requested == 7
             assert isinstance(history.daily_stats, list)
+            assert history.days_with_data == 3
+            assert [ds.date for ds in history.daily_stats] == sorted(
+                ds.date for ds in history.daily_stats
+            )
+            for ds in history.daily_stats:
+                assert ds.total_requests == 1
+                assert ds.tokens.total_tokens == 3150
+                assert ds.models_used == ["claude-sonnet-4"]
+                assert sum(ds.hourly_distribution) == 1
+            assert history.total_tokens == 3 * 3150
 
     def test_get_model_stats_with_entries(self, mock_settings):
         """Test get_model_stats with mock entries."""
-        now = datetime.now(tz.utc)
-
-        entry1 = MagicMock()
-        entry1.timestamp = now
-        entry1.input_tokens = 1000
-        entry1.output_tokens = 2000
-        entry1.cache_creation_tokens = 100
-        entry1.cache_read_tokens = 50
-        entry1.cost_usd = 0.05
-        entry1.model = "claude-sonnet-4"
-
-        entry2 = MagicMock()
-        entry2.timestamp = now
-        entry2.input_tokens = 500
-        entry2.output_tokens = 1000
-        entry2.cache_creation_tokens = 50
-        entry2.cache_read_tokens = 25
-        entry2.cost_usd = 0.02
-        entry2.model = "claude-3-5-haiku"
+        entry1 = fake_entry(NOW, **BASE_FIELDS)
+        entry2 = fake_entry(
+            NOW,
+            input_tokens=500,
+            output_tokens=1000,
+            cache_creation_tokens=50,
+            cache_read_tokens=25,
+            cost_usd=0.02,
+            model="claude-3-5-haiku",
+        )
 
         with patch("app.services.data_service.load_usage_entries") as mock_load:
             mock_load.return_value = ([entry1, entry2], {})
@@ -364,20 +765,37 @@ class TestDataServiceWithMocks:
             assert stats.total_models >= 0
             assert isinstance(stats.models, list)
 
+    def test_get_model_stats_first_and_last_used(self, mock_settings):
+        """Test per-model first/last use and the overall period."""
+        entries = [
+            fake_entry(
+                NOW - timedelta(hours=hours_ago),
+                input_tokens=100,
+                output_tokens=200,
+                cost_usd=0.01,
+                model=model,
+            )
+            for hours_ago, model in (
+                (3, "claude-sonnet-4"),
+                (2, "claude-3-5-haiku"),
+                (1, "claude-sonnet-4"),
+            )
+        ]
+
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
+            mock_load.return_value = (entries, {})
+            service = DataService(settings=mock_settings)
+            stats = service.get_model_stats(days=7)
+
+        sonnet = next(m for m in stats.models if m.model == "claude-sonnet-4")
+        assert sonnet.first_used == entries[0].timestamp
+        assert sonnet.last_used == entries[2].timestamp
+        assert stats.period_start == entries[0].timestamp
+        assert stats.period_end == entries[2].timestamp
+
     def test_get_realtime_usage_with_entries(self, mock_settings):
         """Test get_realtime_usage with mock entries."""
-        now = datetime.now(tz.utc)
-
-        entry = MagicMock()
-        entry.timestamp = now
-        entry.input_tokens = 1000
-        entry.output_tokens = 2000
-        entry.cache_creation_tokens = 100
-        entry.cache_read_tokens = 50
-        entry.cost_usd = 0.05
-        entry.model = "claude-sonnet-4"
-        entry.message_id = "msg-123"
-        entry.request_id = "req-456"
+        entry = fake_entry(NOW, **BASE_FIELDS)
 
         with patch("app.services.data_service.load_usage_entries") as mock_load:
             mock_load.return_value = ([entry], {})
@@ -390,92 +808,248 @@ class TestDataServiceWithMocks:
             assert realtime.burn_rate is not None
             assert isinstance(realtime.recent_entries, list)
 
-    def test_get_plan_usage_with_mocks(self, mock_settings):
-        """Test get_plan_usage with proper mocking."""
-        with patch("app.services.data_service.load_usage_entries") as mock_load, \
-             patch("app.services.data_service.analyze_usage") as mock_analyze, \
-             patch("app.services.data_service.Plans") as mock_plans:
+    def test_get_realtime_usage_recent_entries_newest_first(self, mock_settings):
+        """Test that recent entries are the 50 newest, newest first."""
+        entries = [
+            fake_entry(
+                NOW - timedelta(minutes=i),
+                input_tokens=10,
+                output_tokens=20,
+                cost_usd=0.001,
+                model="claude-sonnet-4",
+                message_id=f"msg-{i}",
+                request_id=f"req-{i}",
+            )
+            for i in reversed(range(60))
+        ]
 
-            # Mock Plans.get_plan_by_name
-            mock_plan = MagicMock()
-            mock_plan.name = "max20"
-            mock_plan.display_name = "Max (20x)"
-            mock_plan.token_limit = 100000000
-            mock_plan.cost_limit = 600
-            mock_plan.message_limit = 1000
-            mock_plans.get_plan_by_name.return_value = mock_plan
-
-            # Mock analyze_usage
-            mock_analyze.return_value = {
-                "blocks": [{
-                    "isActive": True,
-                    "costUSD": 15.50,
-                    "totalTokens": 1500000,
-                    "messageCount": 50,
-                    "startTime": datetime.now(tz.utc).isoformat(),
-                    "endTime": (datetime.now(tz.utc) + timedelta(hours=3)).isoformat(),
-                }]
-            }
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
+            mock_load.return_value = (entries, {})
+            service = DataService(settings=mock_settings)
+            realtime = service.get_realtime_usage()
+
+        assert len(realtime.recent_entries) == 50
+        assert realtime.recent_entries[0].message_id == "msg-0"
+        assert realtime.recent_entries[-1].message_id == "msg-49"
 
+    def test_get_realtime_usage_loads_entries_once(self, mock_settings):
+        """Test that today's stats reuse the entries loaded for realtime."""
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
             mock_load.return_value = ([], {})
             service = DataService(settings=mock_settings)
-            plan_usage = service.get_plan_usage(plan="max20")
+            service.get_realtime_usage()
 
-            assert plan_usage.plan is not None
-            assert plan_usage.cost_usage is not None
-            assert plan_usage.token_usage is not None
+            mock_load.assert_called_once()
+            assert mock_load.call_args.kwargs["hours_back"] == 24
 
-    def test_get_plan_usage_no_active_session(self, mock_settings):
-        """Test get_plan_usage with no active session."""
-        with patch("app.services.data_service.load_usage_entries") as mock_load, \
-             patch("app.services.data_service.analyze_usage") as mock_analyze, \
-             patch("app.services.data_service.Plans") as mock_plans:
+    def test_get_realtime_usage_fingerprints_once(self, mock_settings):
+        """Test that one realtime request computes the data fingerprint once."""
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
+            mock_load.return_value = ([], {})
+            service = DataService(settings=mock_settings)
+            with patch.object(
+                service, "get_data_fingerprint", return_value=(1, 1)
+            ) as mock_fingerprint:
+                service.get_realtime_usage()
 
-            mock_plan = MagicMock()
-            mock_plan.name = "max20"
-            mock_plan.display_name = "Max (20x)"
-            mock_plan.token_limit = 100000000
-            mock_plan.cost_limit = 600
-            mock_plan.message_limit = 1000
-            mock_plans.get_plan_by_name.return_value = mock_plan
-
-            # No active block
-            mock_analyze.return_value = {
-                "blocks": [{
-                    "isActive": False,
-                    "costUSD": 0,
-                    "totalTokens": 0,
-                    "messageCount": 0,
-                }]
-            }
+            mock_fingerprint.assert_called_once()
 
+    def test_get_realtime_usage_reuses_snapshot(self, mock_settings):
+        """Test that realtime usage is reused while data is unchanged."""
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
             mock_load.return_value = ([], {})
             service = DataService(settings=mock_settings)
-            plan_usage = service.get_plan_usage(plan="max20")
 
-            assert plan_usage.plan is not None
-            assert plan_usage.cost_usage.current == 0.0
-            assert plan_usage.token_usage.current == 0.0
+            first = service.get_realtime_usage()
+            second = service.get_realtime_usage()
 
-    def test_get_plan_usage_handles_analyze_failure(self, mock_settings):
-        """Test get_plan_usage handles analyze_usage failure."""
-        with patch("app.services.data_service.load_usage_entries") as mock_load, \
-             patch("app.services.data_service.analyze_usage") as mock_analyze, \
-             patch("app.services.data_service.Plans") as mock_plans:
+            assert first is second
+
+    def test_get_realtime_usage_rebuilds_when_data_changes(self, mock_settings):
+        """Test that a changed data fingerprint rebuilds the snapshot."""
+        with patch("app.services.data_service.load_usage_entries") as mock_load:
+            mock_load.return_value = ([], {})
+            service = DataService(settings=mock_settings)
+
+            with patch.object(service, "get_data_fingerprint", return_value=(1, 1)):
+                first = service.get_realtime_usage()
+            with patch.object(service, "get_data_fingerprint", return_value=(2, 2)):
+                second = service.get_realtime_usage()
+
+            assert first is not second
+
+    def test_get_plan_usage_with_mocks(self, mock_settings, plan_usage_mocks):
+        """Test get_plan_usage with proper mocking."""
+        mock_load, mock_analyze = plan_usage_mocks
+        mock_analyze.return_value = {
+            "blocks": [{
+                "isActive": True,
+                "costUSD": 15.50,
+                "totalTokens": 1500000,
+                "messageCount": 50,
+                "startTime": NOW.isoformat(),
+                "endTime": (NOW + timedelta(hours=3)).isoformat(),
+            }]
+        }
 
-            mock_plan = MagicMock()
-            mock_plan.name = "max20"
-            mock_plan.display_name = "Max (20x)"
-            mock_plan.token_limit = 100000000
-            mock_plan.cost_limit = 600
-            mock_plan.message_limit = 1000
-            mock_plans.get_plan_by_name.return_value = mock_plan
+        service = DataService(settings=mock_settings)
+        plan_usage = service.get_plan_usage(plan="max20")
+
+        assert plan_usage.plan is not None
+        assert plan_usage.cost_usage is not None
+        assert plan_usage.token_usage is not None
+        mock_load.assert_called_once()
+
+    def test_get_plan_usage_parses_block_times_once(self, mock_settings, plan_usage_mocks):
+        """Test that cached analysis blocks carry their parsed session times."""
+        _, mock_analyze = plan_usage_mocks
+        end_time = NOW.replace(microsecond=0) + timedelta(hours=3)
+        block = {
+            "isActive": True,
+            "costUSD": 1.0,
+            "totalTokens": 1000,
+            "startTime": (end_time - timedelta(hours=5)).isoformat().replace("+00:00", "Z"),
+            "endTime": end_time.isoformat().replace("+00:00", "Z"),
+        }
+        mock_analyze.return_value = {"blocks": [block]}
+
+        service = DataService(settings=mock_settings)
+        first = service.get_plan_usage(plan="max20")
+        second = service.get_plan_usage(plan="max20")
+
+        mock_analyze.assert_called_once()
+        assert block["_endTime_dt"] == end_time
+        assert first.reset_info.reset_time == end_time
+        assert second.reset_info.reset_time == end_time
+
+    def test_get_analysis_serves_stale_result_while_refreshing(self, mock_settings, clock):
+        """Test that an expired analysis is served while one refresh runs."""
+        stale = {"blocks": []}
+        service = DataService(settings=mock_settings)
+        service._analysis = (clock[0] - CACHE_TTL - 1, stale)
+
+        with patch("app.services.data_service._refresh_executor") as mock_executor:
+            mock_executor.submit.return_value.done.return_value = False
+
+            assert service._get_analysis() is stale
+            assert service._get_analysis() is stale
+
+            mock_executor.submit.assert_called_once_with(service._refresh_analysis)
+
+    def test_get_analysis_recomputes_past_max_age(self, mock_settings, clock):
+        """Test that a too-old analysis is recomputed inline, not served."""
+        fresh = {"blocks": []}
+        service = DataService(settings=mock_settings)
+        service._analysis = (clock[0] - ANALYSIS_MAX_AGE - 1, {"blocks": [{}]})
+
+        with patch("app.services.data_service.analyze_usage", return_value=fresh):
+            assert service._get_analysis() is fresh
 
+        assert service._analysis == (clock[0], fresh)
+
+    def test_get_analysis_drops_result_past_max_age_on_failure(self, mock_settings, clock):
+        """Test that a too-old analysis is dropped when recomputing fails."""
+        service = DataService(settings=mock_settings)
+        service._analysis = (clock[0] - ANALYSIS_MAX_AGE - 1, {"blocks": [{}]})
+
+        with patch("app.services.data_service.analyze_usage") as mock_analyze:
             mock_analyze.side_effect = Exception("Analysis failed")
-            mock_load.return_value = ([], {})
+            assert service._get_analysis() is None
 
-            service = DataService(settings=mock_settings)
-            plan_usage = service.get_plan_usage(plan="max20")
+        assert service._analysis is None
+
+    def test_refresh_analysis_keeps_old_result_on_failure(self, mock_settings):
+        """Test that a failed background refresh keeps the previous analysis."""
+        service = DataService(settings=mock_settings)
+        service._analysis = (0.0, {"blocks": []})
+
+        with patch("app.services.data_service.analyze_usage") as mock_analyze:
+            mock_analyze.side_effect = Exception("Analysis failed")
+            service._refresh_analysis()
+
+        assert service._analysis == (0.0, {"blocks": []})
+
+    def test_get_plan_usage_no_active_session(self, mock_settings, plan_usage_mocks):
+        """Test get_plan_usage with no active session."""
+        _, mock_analyze = plan_usage_mocks
+        mock_analyze.return_value = {
+            "blocks": [{
+                "isActive": False,
+                "costUSD": 0,
+                "totalTokens": 0,
+                "messageCount": 0,
+            }]
+        }
+
+        service = DataService(settings=mock_settings)
+        plan_usage = service.get_plan_usage(plan="max20")
+
+        assert plan_usage.plan is not None
+        assert plan_usage.cost_usage.current == 0.0
+        assert plan_usage.token_usage.current == 0.0
+
+    def test_get_plan_usage_handles_analyze_failure(self, mock_settings, plan_usage_mocks):
+        """Test get_plan_usage handles analyze_usage failure."""
+        _, mock_analyze = plan_usage_mocks
+        mock_analyze.side_effect = Exception("Analysis failed")
+
+        service = DataService(settings=mock_settings)
+        plan_usage = service.get_plan_usage(plan="max20")
+
+        assert plan_usage.plan is not None
+        assert plan_usage.cost_usage.current == 0.0
+
+
+class TestFormatting:
+    """Tests for plan usage display formatting."""
+
+    @pytest.mark.parametrize("hour, minute", [(0, 5), (9, 30), (12, 0), (15, 45), (23, 59)])
+    def test_format_clock_matches_strftime(self, hour, minute):
+        """Test that the 12-hour clock matches strftime formatting."""
+        moment = datetime(2024, 12, 3, hour, minute, tzinfo=tz.utc)
+
+        assert _format_clock(moment) == moment.strftime("%I:%M %p")
+
+    def test_parse_iso_datetime_without_ciso8601(self, monkeypatch):
+        """Test that the stdlib fallback accepts a trailing Z."""
+        monkeypatch.setattr("app.services.data_service._ciso_parse_datetime", None)
+
+        parsed = _parse_iso_datetime("2024-12-03T10:00:00Z")
+
+        assert parsed == datetime(2024, 12, 3, 10, 0, tzinfo=tz.utc)
+
+    @pytest.mark.parametrize(
+        "current, limit, percentage",
+        [(15.5, 600.0, 2.6), (750.0, 600.0, 125.0), (10.0, 0.0, 0.0)],
+    )
+    def test_usage_vs_limit(self, current, limit, percentage):
+        """Test that usage percentages match validated construction."""
+        usage = _usage_vs_limit(current, limit, "current", "limit")
+
+        assert usage == UsageVsLimit(
+            current=current,
+            limit=limit,
+            percentage=percentage,
+            formatted_current="current",
+            formatted_limit="limit",
+        )
+
+    def test_format_plan_limits(self):
+        """Test that plan limit labels are formatted once and reused."""
+        labels = _format_plan_limits(600, 100000000, 1000)
+
+        assert labels == ("$600.00", "100,000,000", "1000")
+        assert _format_plan_limits(600, 100000000, 1000) is labels
+
+
+class TestGetDataService:
+    """Tests for the shared DataService accessor."""
+
+    def test_returns_singleton(self, monkeypatch):
+        """Test that the service is created once and then reused."""
+        monkeypatch.setattr("app.services.data_service._data_service", None)
+
+        first = get_data_service()
 
-            assert plan_usage.plan is not None
-            assert plan_usage.cost_usage.current == 0.0
+        assert isinstance(first, DataService)
+        assert get_data_service() is first
@@ -0,0 +1,302 @@
+"""Unit tests for the WebSocket connection manager."""
+
+import asyncio
+import zlib
+from datetime import datetime
+from datetime import timezone as tz
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import orjson
+import pytest
+
+from app.core.config import SETTINGS, Settings
+from app.routers.websocket import (
+    DEFLATE_SUBPROTOCOL,
+    ConnectionManager,
+    broadcast_loop,
+    encode_message,
+    get_broadcast_payload,
+    get_realtime_data,
+)
+from app.services.data_service import DataService
+
+
+def make_websocket(subprotocols: list[str] | None = None) -> AsyncMock:
+    """Create a mock WebSocket with async send methods."""
+    websocket = AsyncMock()
+    websocket.scope = {"subprotocols": subprotocols or []}
+    websocket.send_bytes = AsyncMock()
+    websocket.send_text = AsyncMock()
+    return websocket
+
+
+class TestEncodeMessage:
+    """Tests for message serialization."""
+
+    def test_encodes_datetimes_natively(self):
+        """Test that datetime values are serialized as ISO strings."""
+        timestamp = datetime(2024, 12, 3, 10, 0, tzinfo=tz.utc)
+        payload = encode_message({"type": "realtime_update", "timestamp": timestamp})
+
+        assert orjson.loads(payload) == {
+            "type": "realtime_update",
+            "timestamp": "2024-12-03T10:00:00+00:00",
+        }
+
+
+async def drain() -> None:
+    """Let pending sender tasks run."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def wait_for(event: asyncio.Event):
+    """Create a send side effect that blocks until the event is set."""
+
+    async def send(_payload: object) -> None:
+        await event.wait()
+
+    return send
+
+
+class TestGetRealtimeData:
+    """Tests for building the realtime broadcast message."""
+
+    @pytest.mark.asyncio
+    async def test_realtime_message_shape(self, monkeypatch, tmp_path):
+        """Test that the message carries the JSON-ready realtime snapshot."""
+        service = DataService(settings=Settings(CLAUDE_DATA_PATH=str(tmp_path)))
+        monkeypatch.setattr("app.routers.websocket.get_data_service", lambda: service)
+
+        with patch("app.services.data_service.load_usage_entries", return_value=([], {})):
+            data = await get_realtime_data()
+
+        assert data["type"] == "realtime_update"
+        assert isinstance(data["timestamp"], str)
+        assert set(data) == {
+            "type",
+            "timestamp",
+            "session",
+            "today_stats",
+            "burn_rate",
+            "recent_entries_count",
+        }
+        assert data["today_stats"]["tokens"]["total_tokens"] == 0
+        assert data["recent_entries_count"] == 0
+
+
+class TestConnectionManager:
+    """Tests for ConnectionManager broadcasting."""
+
+    @pytest.fixture
+    async def manager(self):
+        """Create a manager and stop its sender tasks afterwards."""
+        manager = ConnectionManager()
+        yield manager
+        for websocket in list(manager._active_connections):
+            await manager.disconnect(websocket)
+
+    @pytest.mark.asyncio
+    async def test_broadcast_sends_binary_frames(self, manager):
+        """Test that broadcast sends the encoded payload to every client."""
+        clients = [make_websocket(), make_websocket()]
+        for client in clients:
+            await manager.connect(client)
+
+        await manager.broadcast({"type": "realtime_update"})
+        await drain()
+
+        for client in clients:
+            client.send_bytes.assert_awaited_once_with(b'{"type":"realtime_update"}')
+
+    @pytest.mark.asyncio
+    async def test_broadcast_text_frames_when_disabled(self, manager, monkeypatch):
+        """Test that text frames are used when binary frames are disabled."""
+        monkeypatch.setattr(
+            "app.routers.websocket.SETTINGS.WEBSOCKET_BINARY_FRAMES", False
+        )
+        client = make_websocket()
+        await manager.connect(client)
+
+        await manager.broadcast({"type": "realtime_update"})
+        await drain()
+
+        client.send_text.assert_awaited_once_with('{"type":"realtime_update"}')
+        client.send_bytes.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_drops_failed_connections(self, manager):
+        """Test that clients whose send fails are removed."""
+        healthy = make_websocket()
+        broken = make_websocket()
+        broken.send_bytes.side_effect = RuntimeError("connection closed")
+        await manager.connect(healthy)
+        await manager.connect(broken)
+
+        await manager.broadcast({"type": "realtime_update"})
+        await drain()
+
+        assert manager.connection_count == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self, manager):
+        """Test that a slow client does not block sends to other clients."""
+        release = asyncio.Event()
+        slow = make_websocket()
+        slow.send_bytes.side_effect = wait_for(release)
+        fast = make_websocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        await manager.broadcast({"type": "realtime_update"})
+        await drain()
+
+        fast.send_bytes.assert_awaited_once()
+        assert slow.send_bytes.await_count == 1
+        release.set()
+        assert manager.connection_count == 2
+
+    @pytest.mark.asyncio
+    async def test_deflate_clients_receive_shared_compressed_payload(self, manager):
+        """Test that deflate clients get one compressed copy of a broadcast."""
+        clients = [make_websocket([DEFLATE_SUBPROTOCOL]) for _ in range(2)]
+        plain = make_websocket()
+        for client in (*clients, plain):
+            await manager.connect(client)
+
+        await manager.broadcast({"type": "realtime_update"})
+        await drain()
+
+        clients[0].accept.assert_awaited_once_with(subprotocol=DEFLATE_SUBPROTOCOL)
+        first = clients[0].send_bytes.await_args.args[0]
+        second = clients[1].send_bytes.await_args.args[0]
+        assert first is second
+        assert zlib.decompress(first) == b'{"type":"realtime_update"}'
+        plain.send_bytes.assert_awaited_once_with(b'{"type":"realtime_update"}')
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_oldest_payload(self, manager, monkeypatch):
+        """Test that a backed-up client keeps only the newest payloads."""
+        monkeypatch.setattr("app.routers.websocket.OUTBOUND_QUEUE_SIZE", 2)
+        release = asyncio.Event()
+        client = make_websocket()
+        client.send_bytes.side_effect = wait_for(release)
+        await manager.connect(client)
+
+        # The first payload is picked up by the sender, which then blocks
+        await manager.broadcast_raw(b"1")
+        await drain()
+        for payload in (b"2", b"3", b"4"):
+            await manager.broadcast_raw(payload)
+        release.set()
+        await drain()
+
+        sent = [call.args[0] for call in client.send_bytes.await_args_list]
+        assert sent == [b"1", b"3", b"4"]
+
+
+class TestBroadcastLoop:
+    """Tests for the periodic broadcast task."""
+
+    @pytest.mark.asyncio
+    async def test_compute_time_comes_out_of_sleep(self, monkeypatch):
+        """Test that ticks keep a fixed cadence despite slow payload builds."""
+        monkeypatch.setattr("app.routers.websocket.SETTINGS.WEBSOCKET_BROADCAST_INTERVAL", 10)
+        loop = asyncio.get_running_loop()
+        clock = [1000.0]
+        monkeypatch.setattr(loop, "time", lambda: clock[0])
+
+        async def slow_payload() -> bytes:
+            clock[0] += 3
+            return b"{}"
+
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+            clock[0] += delay
+            if len(sleeps) == 2:
+                raise asyncio.CancelledError
+
+        fake_manager = MagicMock(connection_count=1, broadcast_raw=AsyncMock())
+        monkeypatch.setattr("app.routers.websocket.manager", fake_manager)
+        monkeypatch.setattr("app.routers.websocket.get_broadcast_payload", slow_payload)
+        monkeypatch.setattr("app.routers.websocket.asyncio.sleep", fake_sleep)
+
+        await broadcast_loop()
+
+        assert sleeps == [7, 7]
+        assert fake_manager.broadcast_raw.await_count == 2
+
+
+class TestBroadcastPayloadCache:
+    """Tests for reusing encoded broadcast payloads."""
+
+    @pytest.fixture(autouse=True)
+    def reset_payload_cache(self, monkeypatch):
+        """Start each test with an empty payload cache."""
+        monkeypatch.setattr("app.routers.websocket._payload_cache", None)
+
+    @pytest.fixture
+    def data_service(self, monkeypatch, mock_data_service):
+        """Patch the data service used for fingerprinting."""
+        mock_data_service.get_data_fingerprint.return_value = (1, 100)
+        monkeypatch.setattr(
+            "app.routers.websocket.get_data_service", lambda: mock_data_service
+        )
+        return mock_data_service
+
+    @pytest.fixture
+    def realtime_data(self, monkeypatch):
+        """Patch realtime data generation with a call-counting mock."""
+        mock = AsyncMock(return_value={"type": "realtime_update"})
+        monkeypatch.setattr("app.routers.websocket.get_realtime_data", mock)
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_reuses_payload_when_data_unchanged(self, data_service, realtime_data):
+        """Test that unchanged data reuses the previously encoded payload."""
+        first = await get_broadcast_payload()
+        second = await get_broadcast_payload()
+
+        assert first is second
+        assert realtime_data.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_passes_fingerprint_to_realtime_data(self, data_service, realtime_data):
+        """Test that the tick's fingerprint is reused instead of recomputed."""
+        await get_broadcast_payload()
+
+        data_service.get_data_fingerprint.assert_called_once()
+        realtime_data.assert_awaited_once_with((1, 100))
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_payload_when_data_changes(self, data_service, realtime_data):
+        """Test that a changed fingerprint rebuilds the payload."""
+        await get_broadcast_payload()
+        data_service.get_data_fingerprint.return_value = (2, 200)
+        await get_broadcast_payload()
+
+        assert realtime_data.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_payload_older_than_interval(
+        self, data_service, realtime_data, monkeypatch
+    ):
+        """Test that each broadcast tick gets fresh data despite unchanged files."""
+        clock = [1000.0]
+        monkeypatch.setattr("app.routers.websocket.time.monotonic", lambda: clock[0])
+        await get_broadcast_payload()
+        clock[0] += SETTINGS.WEBSOCKET_BROADCAST_INTERVAL
+        await get_broadcast_payload()
+
+        assert realtime_data.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_does_not_cache_errors(self, data_service, realtime_data):
+        """Test that error payloads are not reused."""
+        realtime_data.return_value = {"type": "error", "error": "boom"}
+        await get_broadcast_payload()
+        await get_broadcast_payload()
+
+        assert realtime_data.await_count == 2
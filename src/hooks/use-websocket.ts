@@ -25,6 +25,7 @@ const INITIAL_RECONNECT_DELAY = 1000; // 1 second
 const MAX_RECONNECT_DELAY = 30000; // 30 seconds max
 const MAX_RECONNECT_ATTEMPTS = 10; // Increased from 5 due to backoff
 const HEARTBEAT_INTERVAL = 30000; // 30 seconds
+const textDecoder = new TextDecoder();
 
 /**
  * Calculate exponential backoff delay with jitter
@@ -129,7 +130,11 @@ export function useWebSocket(options: UseWebSocketOptions = {}): UseWebSocketRet
   const handleMessage = React.useCallback(
     (event: MessageEvent) => {
       try {
-        const message: WebSocketMessage = JSON.parse(event.data);
+        // Backend sends JSON as binary frames by default
+        const raw = typeof event.data === 'string'
+          ? event.data
+          : textDecoder.decode(event.data as ArrayBuffer);
+        const message: WebSocketMessage = JSON.parse(raw);
 
         setState((prev) => ({ ...prev, lastMessage: message }));
 
@@ -208,6 +213,7 @@ export function useWebSocket(options: UseWebSocketOptions = {}): UseWebSocketRet
 
     try {
       wsRef.current = new WebSocket(WS_URL);
+      wsRef.current.binaryType = 'arraybuffer';
 
       wsRef.current.onopen = () => {
         reconnectAttemptsRef.current = 0;
@@ -178,7 +178,7 @@ interface BackendTodayStats {
   tokens: BackendTokens;
   total_cost_usd: number;
   models_used: string[];
-  hourly_distribution: Record<string, number>;
+  hourly_distribution: number[]; // 24 slots, index = hour of day
 }
 
 interface BackendBurnRate {
@@ -197,6 +197,7 @@ interface BackendRealtimeResponse {
     output_tokens: number;
     cache_creation_tokens: number;
     cache_read_tokens: number;
+    total_tokens: number;
     cost_usd: number;
     model: string;
   }>;
@@ -268,10 +269,10 @@ function transformToCurrentSession(session: BackendSession, tokens: BackendToken
   };
 }
 
-function transformHourlyToUsageByPeriod(hourlyDist: Record<string, number>): UsageByPeriod[] {
+function transformHourlyToUsageByPeriod(hourlyDist: number[]): UsageByPeriod[] {
   const hours = Array.from({ length: 24 }, (_, i) => i);
   return hours.map(hour => {
-    const count = hourlyDist[String(hour)] || 0;
+    const count = hourlyDist[hour] || 0;
     return {
       period: `${String(hour).padStart(2, '0')}:00`,
       tokens: {